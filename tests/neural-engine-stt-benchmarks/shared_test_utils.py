@@ -29,7 +29,7 @@ these tests run their OWN transcription engine instead of
 the Swift helper process.
 
 DEPENDENCIES:
-  pip install pyaudio numpy soundfile
+  pip install pyaudio numpy scipy soundfile rapidfuzz
   brew install portaudio  (needed for pyaudio on macOS)
 
 CREATED: 2026-02-07 from research on Neural Engine optimized
@@ -38,15 +38,21 @@ alternatives to Apple's SpeechAnalyzer and raw whisper.cpp.
 ============================================================
 """
 
+import atexit
+import functools
+import hashlib
+import io
 import subprocess
 import time
 import os
 import sys
 import json
-import wave
-import tempfile
+import re
+import threading
+import queue
 import struct
 from datetime import datetime
+from pathlib import Path
 
 
 # ============================================================
@@ -56,22 +62,39 @@ from datetime import datetime
 # All paths are relative to this file's directory so tests
 # can be run from anywhere (as long as the project structure
 # remains the same). The SCRIPT_DIR/PROJECT_DIR pattern is
-# used in all our other test files for consistency.
-SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-TESTS_DIR = os.path.dirname(SCRIPT_DIR)
-PROJECT_DIR = os.path.dirname(TESTS_DIR)
-RESULTS_DIR = os.path.join(SCRIPT_DIR, "results")
-TMP_DIR = os.path.join(PROJECT_DIR, "tmp")
-MODELS_DIR = os.path.join(TMP_DIR, "neural-engine-models")
+# used in all our other test files for consistency. These are
+# pathlib.Path objects built once at import; os.path.join()
+# accepts them directly, so callers don't need to change.
+SCRIPT_DIR = Path(__file__).resolve().parent
+TESTS_DIR = SCRIPT_DIR.parent
+PROJECT_DIR = TESTS_DIR.parent
+RESULTS_DIR = SCRIPT_DIR / "results"
+TMP_DIR = PROJECT_DIR / "tmp"
+MODELS_DIR = TMP_DIR / "neural-engine-models"
+SCENARIO_CACHE_DIR = MODELS_DIR / "scenario_cache"  # Rendered `say` WAVs
+
+# Directories we've already created this process. Lets
+# ensure_directories() and MarkdownResultWriter skip the
+# mkdir syscall after the first time.
+_ENSURED_DIRS = set()
+
+
+def _ensure_dir(path):
+    """Create a directory (and parents) at most once per process."""
+    path = Path(path)
+    if path not in _ENSURED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(path)
 
 # Audio configuration — matching Whisper's expected input
-# format. Whisper models expect 16kHz mono audio. We also
-# keep 48kHz for the raw capture since that's the default
-# macOS mic sample rate, then resample down to 16kHz.
+# format. Whisper models expect 16kHz mono audio. We capture
+# at 48kHz since that's the default macOS mic sample rate,
+# then resample down to 16kHz once the recording is done.
 SAMPLE_RATE_MIC = 48000     # macOS default mic sample rate
 SAMPLE_RATE_WHISPER = 16000  # What Whisper models expect
 CHANNELS = 1                 # Mono audio for speech
 CHUNK_SIZE = 1024            # PyAudio buffer size
+REALTIME_BUFFER_SECONDS = 0.016  # record_audio_chunk() default buffer (16ms)
 FORMAT_BITS = 16             # 16-bit PCM audio
 
 # Timing constants — these are tuned based on our experience
@@ -115,6 +138,13 @@ C = TerminalColors()
 # speakers and gets picked up by the microphone, simulating
 # a real user speaking.
 
+# For `say`/`afplay` calls whose output we never look at.
+# capture_output=True would allocate two pipes and buffer
+# everything the child prints; sending it to /dev/null skips
+# that (same as say_async already does).
+_QUIET = {"stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL}
+
+
 def say_and_wait(text, rate=140, voice=None):
     """
     Play text using macOS `say` command and block until done.
@@ -135,7 +165,7 @@ def say_and_wait(text, rate=140, voice=None):
     if voice:
         cmd.extend(["-v", voice])
     cmd.append(text)
-    proc = subprocess.run(cmd, capture_output=True, timeout=60)
+    subprocess.run(cmd, **_QUIET, timeout=60)
     elapsed = time.time() - start
     return elapsed
 
@@ -157,34 +187,138 @@ def say_to_wav_file(text, output_path, rate=140, voice=None):
         rate: Words per minute
         voice: macOS voice name
     """
-    # macOS `say` outputs AIFF by default, we convert to WAV
-    aiff_path = output_path.replace('.wav', '.aiff')
-    if not aiff_path.endswith('.aiff'):
-        aiff_path = output_path + '.aiff'
-    
-    cmd = ["/usr/bin/say", "-r", str(rate), "-o", aiff_path]
+    # `say` can write 16kHz 16-bit mono WAV (what Whisper expects)
+    # directly, so there's no AIFF intermediate or afconvert pass.
+    cmd = [
+        "/usr/bin/say", "-r", str(rate), "-o", output_path,
+        "--file-format=WAVE", "--data-format=LEI16@16000",
+    ]
     if voice:
         cmd.extend(["-v", voice])
     cmd.append(text)
-    subprocess.run(cmd, capture_output=True, timeout=60)
+    subprocess.run(cmd, **_QUIET, timeout=60)
     
-    # Convert AIFF to WAV using afconvert (macOS built-in)
-    # We use 16kHz 16-bit mono which is what Whisper expects
-    subprocess.run([
-        "afconvert", "-f", "WAVE", "-d", "LEI16@16000",
-        "-c", "1", aiff_path, output_path
-    ], capture_output=True, timeout=60)
+    return output_path
+
+
+def get_or_render_scenario_wav(scenario, voice=None):
+    """
+    Return the path to a 16kHz WAV of a scenario's text, rendering
+    it with `say` only if it isn't already cached on disk.
     
-    # Clean up the intermediate AIFF
-    if os.path.exists(aiff_path) and aiff_path != output_path:
-        os.unlink(aiff_path)
+    WHY: STANDARD_SCENARIOS are fixed, but every engine (and every
+    model within an engine) used to re-render each one with `say`.
+    The rendered audio is identical each time, so we cache it (see
+    cached_say_to_wav) and reuse it across models, engines and runs.
     
-    return output_path
+    Callers must NOT delete the returned file — it's shared.
+    
+    Args:
+        scenario: A BenchmarkScenario (uses .text and .rate)
+        voice: macOS voice name (None = system default)
+    """
+    return cached_say_to_wav(scenario.text, rate=scenario.rate, voice=voice)
+
+
+def cached_say_to_wav(text, rate=140, voice=None):
+    """
+    Return the path to a 16kHz WAV of `text`, rendering it with
+    `say` only if it isn't already cached on disk.
+    
+    WHY: `say` output is deterministic for a given (text, rate,
+    voice), so any phrase that's spoken more than once — scenario
+    audio, quiet-speech playback — is rendered once into
+    SCENARIO_CACHE_DIR and reused across calls and runs.
+    
+    Callers must NOT delete the returned file — it's shared.
+    """
+    key = hashlib.blake2b(
+        f"{text}|{rate}|{voice}".encode("utf-8")
+    ).hexdigest()[:16]
+    wav_path = SCENARIO_CACHE_DIR / f"scenario_{key}.wav"
+    
+    if not wav_path.is_file() or wav_path.stat().st_size == 0:
+        _ensure_dir(SCENARIO_CACHE_DIR)
+        # Render to a temp name and rename, so an interrupted
+        # render never leaves a truncated file in the cache
+        tmp_path = wav_path.with_suffix(f".{os.getpid()}.tmp.wav")
+        say_to_wav_file(text, str(tmp_path), rate=rate, voice=voice)
+        os.replace(tmp_path, wav_path)
+    
+    return str(wav_path)
+
+
+def prerender_scenario_wavs(scenarios, voice=None):
+    """
+    Render (or find in the cache) every scenario's WAV and return
+    {scenario.name: wav_path}.
+    
+    WHY: Scripts that benchmark several model configs call this
+    once at startup — typically in a background thread while the
+    models load — and hand the dict to each file benchmark, so
+    no config ever waits on `say`.
+    """
+    return {s.name: get_or_render_scenario_wav(s, voice) for s in scenarios}
+
+
+def iter_scenario_wavs(scenarios, voice=None, prefetch=2):
+    """
+    Yield (scenario, wav_path) for each scenario, rendering the
+    next ones in a background thread while the caller works.
+    
+    WHY: On a cold cache, a file benchmark used to alternate
+    `say` rendering (~utterance length) with model inference,
+    strictly one after the other. The two use different
+    resources (the speech synthesizer vs the GPU/ANE), so a
+    producer thread renders up to `prefetch` scenarios ahead
+    into a bounded queue and the inference loop just pops them.
+    On a warm cache the producer is a quick file-exists check.
+    
+    Paths come from get_or_render_scenario_wav(), so callers
+    must NOT delete them. A render error is re-raised here in
+    the caller's thread. Stopping early (break / exception)
+    tells the producer to quit.
+    """
+    wavs = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+    done = object()
+    
+    def produce():
+        try:
+            for scenario in scenarios:
+                item = (scenario, get_or_render_scenario_wav(scenario, voice))
+                # Re-check stop periodically so an abandoned
+                # consumer can't leave us blocked on a full queue
+                while not stop.is_set():
+                    try:
+                        wavs.put(item, timeout=0.5)
+                        break
+                    except queue.Full:
+                        pass
+                if stop.is_set():
+                    return
+        except Exception as e:
+            wavs.put(e)
+            return
+        wavs.put(done)
+    
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = wavs.get()
+            if item is done:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
 
 
 def say_to_aiff_and_play(text, rate=140, volume=0.5):
     """
-    Render speech to AIFF then play with volume control.
+    Render speech to a file then play it with volume control.
     Returns the total duration (render + playback) in seconds.
     
     WHY: We need volume control for quiet-speech tests.
@@ -192,24 +326,48 @@ def say_to_aiff_and_play(text, rate=140, volume=0.5):
     `afplay` does (via -v). So we render to file first,
     then play at the desired volume.
     
+    NOTE: Despite the name (kept so existing imports work),
+    this renders WAV via cached_say_to_wav() — `afplay` plays
+    it just the same, and repeated phrases skip the render.
+    
     This is the same approach used in test-stt-comprehensive.py
     scenario 8 (Quiet Speech).
     """
     start = time.time()
-    aiff_path = f"/tmp/neural_stt_test_{os.getpid()}.aiff"
-    subprocess.run(
-        ["/usr/bin/say", "-r", str(rate), "-o", aiff_path, text],
-        capture_output=True, timeout=60
-    )
+    wav_path = cached_say_to_wav(text, rate=rate)
     subprocess.run(
-        ["afplay", "-v", str(volume), aiff_path],
-        capture_output=True, timeout=60
+        ["afplay", "-v", str(volume), wav_path],
+        **_QUIET, timeout=60
     )
-    elapsed = time.time() - start
-    # Clean up
-    if os.path.exists(aiff_path):
-        os.unlink(aiff_path)
-    return elapsed
+    return time.time() - start
+
+
+def prewarm_say(voice=None):
+    """
+    Render one throwaway word with `say` so the speech synthesizer
+    and voice are loaded before any timed or recorded phrase.
+    
+    WHY: The first `say` in a session pays for starting the
+    speech service and loading the voice, which lands in the
+    first scenario's render or the first chunked-realtime phrase.
+    A persistent `say` pool isn't possible (one process writes a
+    single output file or speaks one stream), but the service
+    stays warm between processes, so paying once up front is
+    enough. Renders to a temp file so nothing plays aloud.
+    """
+    _ensure_dir(TMP_DIR)
+    tmp_path = TMP_DIR / f"say_prewarm_{os.getpid()}.wav"
+    cmd = ["/usr/bin/say", "-o", str(tmp_path), "--file-format=WAVE"]
+    if voice:
+        cmd.extend(["-v", voice])
+    cmd.append("ready")
+    try:
+        subprocess.run(cmd, timeout=30, **_QUIET)
+    except (OSError, subprocess.TimeoutExpired):
+        pass
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
 
 
 def say_async(text, rate=140, voice=None):
@@ -235,6 +393,26 @@ def say_async(text, rate=140, voice=None):
 # ACCURACY MEASUREMENT
 # ============================================================
 
+# Punctuation that STT engines handle inconsistently. Compiled
+# once here rather than on every accuracy call.
+_PUNCT_RE = re.compile(r'[^\w\s]')
+
+
+def _clean(text):
+    """Lowercase, strip punctuation, and split into words."""
+    return _PUNCT_RE.sub('', text.lower()).split()
+
+
+def _as_tokens(text_or_tokens):
+    """
+    Accept either raw text or an already-cleaned word list
+    (e.g. BenchmarkScenario.ref_tokens()) and return words.
+    """
+    if isinstance(text_or_tokens, str):
+        return _clean(text_or_tokens)
+    return text_or_tokens
+
+
 def word_accuracy(expected, got):
     """
     Calculate word-level accuracy between expected and transcribed text.
@@ -245,14 +423,13 @@ def word_accuracy(expected, got):
     content words were captured, not exact ordering. This is
     the same metric used in test-stt-comprehensive.py.
     
+    Either argument may be a pre-tokenized word list instead of
+    a string (see BenchmarkScenario.ref_tokens()).
+    
     Returns a float 0.0 to 1.0 (1.0 = perfect match).
     """
-    # Strip punctuation that STT engines handle inconsistently
-    import re
-    clean = lambda s: set(re.sub(r'[^\w\s]', '', s.lower()).split())
-    
-    expected_words = clean(expected)
-    got_words = clean(got)
+    expected_words = frozenset(_as_tokens(expected))
+    got_words = frozenset(_as_tokens(got))
     
     if not expected_words:
         return 0.0
@@ -274,47 +451,153 @@ def word_error_rate(reference, hypothesis):
     
     Lower WER = better. 0.0 = perfect, 1.0 = completely wrong.
     Can exceed 1.0 if there are many insertions.
+    
+    Either argument may be a pre-tokenized word list instead of
+    a string (see BenchmarkScenario.ref_tokens()).
+    """
+    return _accuracy_and_wer(
+        tuple(_as_tokens(reference)), tuple(_as_tokens(hypothesis))
+    )[1]
+
+
+def word_accuracy_and_wer(expected, got):
+    """
+    Return (word_accuracy, word_error_rate) for one transcript.
+    
+    WHY a combined helper: Every benchmark row reports both
+    metrics. Calling the two functions separately cleans and
+    splits the transcript twice; this tokenizes each side once
+    and runs a single edit-distance pass. Results are identical
+    to word_accuracy() and word_error_rate().
     """
-    import re
-    clean = lambda s: re.sub(r'[^\w\s]', '', s.lower()).split()
+    return _accuracy_and_wer(tuple(_as_tokens(expected)), tuple(_as_tokens(got)))
+
+
+@functools.lru_cache(maxsize=512)
+def _accuracy_and_wer(ref_words, hyp_words):
+    """
+    (accuracy, WER) for two word tuples, memoized.
     
-    ref_words = clean(reference)
-    hyp_words = clean(hypothesis)
+    WHY cache on tokens: the same expected text meets the same
+    transcript again across models, chunk durations and reruns
+    (short phrases especially), and the edit-distance DP is the
+    only non-trivial cost here. Keying on cleaned words rather
+    than raw strings also makes "Hello, world." and "hello world"
+    share an entry. word_accuracy() alone isn't routed through
+    this: a set intersection costs about as much as hashing the key.
+    """
+    ref_set = frozenset(ref_words)
+    acc = len(ref_set & frozenset(hyp_words)) / len(ref_set) if ref_set else 0.0
     
-    # Dynamic programming for edit distance
     n = len(ref_words)
-    m = len(hyp_words)
+    if n == 0:
+        wer = float(len(hyp_words)) if hyp_words else 0.0
+    else:
+        wer = _word_edit_distance(ref_words, hyp_words) / n
+    
+    return acc, wer
+
+
+def _word_edit_distance(ref_words, hyp_words):
+    """
+    Levenshtein distance between two word lists.
+    
+    WHY rapidfuzz first: Its Levenshtein works on any sequence of
+    hashables (here, word lists) in optimized C, so a WER call
+    never touches a Python-level DP loop. Without rapidfuzz we
+    fall back to a Numba-compiled DP over word ids, and without
+    numba to a NumPy row-at-a-time DP.
+    """
+    try:
+        from rapidfuzz.distance import Levenshtein
+    except ImportError:
+        pass
+    else:
+        return Levenshtein.distance(ref_words, hyp_words)
+    
+    import numpy as np
     
-    # dp[i][j] = edit distance between ref[:i] and hyp[:j]
-    dp = [[0] * (m + 1) for _ in range(n + 1)]
+    # Map words to integer ids so the DP compares ints instead of
+    # Python strings.
+    vocab = {}
+    ref = np.array([vocab.setdefault(w, len(vocab)) for w in ref_words], dtype=np.int32)
+    hyp = np.array([vocab.setdefault(w, len(vocab)) for w in hyp_words], dtype=np.int32)
     
-    for i in range(n + 1):
-        dp[i][0] = i
-    for j in range(m + 1):
-        dp[0][j] = j
+    kernel = _get_levenshtein_kernel()
+    if kernel:
+        return int(kernel(ref, hyp))
+    
+    n = len(ref)
+    m = len(hyp)
+    
+    # Dynamic programming for edit distance, one row at a time.
+    # prev[j] = edit distance between ref[:i] and hyp[:j] for the
+    # last completed row i (row 0 is just j insertions).
+    cols = np.arange(m + 1, dtype=np.int32)
+    prev = cols.copy()
     
     for i in range(1, n + 1):
-        for j in range(1, m + 1):
-            if ref_words[i-1] == hyp_words[j-1]:
-                dp[i][j] = dp[i-1][j-1]
-            else:
-                dp[i][j] = 1 + min(
-                    dp[i-1][j],      # deletion
-                    dp[i][j-1],      # insertion
-                    dp[i-1][j-1]     # substitution
-                )
+        # Substitution (or match) from the diagonal, deletion from above
+        curr = np.empty(m + 1, dtype=np.int32)
+        curr[0] = i
+        curr[1:] = np.minimum(prev[:-1] + (hyp != ref[i-1]), prev[1:] + 1)
+        # Insertion depends on curr[j-1], a serial chain. Since
+        # curr[j] = min over k <= j of (curr[k] + (j - k)), it folds
+        # into a running minimum of curr[k] - k.
+        prev = np.minimum.accumulate(curr - cols) + cols
     
-    if n == 0:
-        return float(m) if m > 0 else 0.0
+    return int(prev[m])
+
+
+# Numba-compiled word-id Levenshtein. None = not built yet,
+# False = numba isn't installed (use the NumPy path).
+_LEVENSHTEIN_KERNEL = None
+
+
+def _get_levenshtein_kernel():
+    """
+    Build (once) and return the Numba two-row Levenshtein kernel
+    over int32 id arrays, or False if numba isn't available.
     
-    return dp[n][m] / n
+    WHY: For the short phrases most scenarios use, the NumPy DP
+    spends its time in per-row array setup rather than arithmetic.
+    A compiled scalar loop has no such overhead, so the metric
+    stays negligible next to the inference times we report.
+    """
+    global _LEVENSHTEIN_KERNEL
+    if _LEVENSHTEIN_KERNEL is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _LEVENSHTEIN_KERNEL = False
+        else:
+            import numpy as np
+            
+            @njit(cache=True)
+            def _levenshtein(a, b):
+                m = b.size
+                prev = np.arange(m + 1, dtype=np.int32)
+                curr = np.empty(m + 1, dtype=np.int32)
+                for i in range(1, a.size + 1):
+                    curr[0] = i
+                    ai = a[i - 1]
+                    for j in range(1, m + 1):
+                        cost = prev[j - 1] + (1 if b[j - 1] != ai else 0)
+                        cost = min(cost, prev[j] + 1, curr[j - 1] + 1)
+                        curr[j] = cost
+                    prev, curr = curr, prev
+                return prev[m]
+            _LEVENSHTEIN_KERNEL = _levenshtein
+    return _LEVENSHTEIN_KERNEL
 
 
 # ============================================================
 # MICROPHONE CAPTURE
 # ============================================================
 
-def record_audio_chunk(duration_seconds, sample_rate=SAMPLE_RATE_WHISPER):
+def record_audio_chunk(duration_seconds, sample_rate=SAMPLE_RATE_WHISPER,
+                       native_rate=SAMPLE_RATE_MIC, chunk_size=None,
+                       prefix_seconds=None, on_prefix=None):
     """
     Record audio from the default microphone for a fixed duration.
     Returns a numpy array of float32 samples normalized to [-1, 1].
@@ -323,15 +606,48 @@ def record_audio_chunk(duration_seconds, sample_rate=SAMPLE_RATE_WHISPER):
     whisper.cpp, sherpa-onnx) expect float32 audio normalized
     to [-1, 1] range. PyAudio gives us int16 which we convert.
     
-    IMPORTANT: Requires `pip install pyaudio numpy` and
+    WHY capture at native_rate: The Mac mic runs at 48kHz. If we
+    open the stream at 16kHz, PortAudio resamples every buffer on
+    the capture thread. Instead we capture at the hardware rate and
+    downsample the whole recording in one shot after the stream is
+    closed, which keeps the real-time path doing nothing but copies.
+    Pass native_rate=sample_rate to capture directly with no resample.
+    
+    WHY a small chunk_size: The PortAudio buffer size is the floor
+    on capture latency — the old 1024 frames at 16kHz held 64ms of
+    audio before we saw any of it. We default to ~16ms buffers
+    (REALTIME_BUFFER_SECONDS at native_rate). Smaller buffers cost
+    slightly more CPU and callback wakeups, which callback mode
+    absorbs easily. PortAudio's suggestedLatency can't be passed
+    through PyAudio's open(); PyAudio already requests the device's
+    defaultLowInputLatency, and CoreAudio rounds the buffer up to
+    its host buffer size either way.
+    
+    WHY no thread-priority changes: in callback mode the audio is
+    captured on PortAudio's CoreAudio I/O thread, which already runs
+    at real-time priority. The caller's thread only waits, so it is
+    left at whatever QoS the caller chose.
+    
+    WHY on_prefix: capture runs on PortAudio's thread, so the caller's
+    thread is idle until the buffer fills. With on_prefix set, it is
+    called on the caller's thread with the first prefix_seconds of
+    audio (already at sample_rate) as soon as they're captured, and
+    recording continues meanwhile — e.g. transcribe a chunk while
+    the tail of a longer capture is still coming in.
+    
+    IMPORTANT: Requires `pip install pyaudio numpy scipy` and
     `brew install portaudio` on macOS.
     
     Args:
         duration_seconds: How long to record
-        sample_rate: Audio sample rate (default 16kHz for Whisper)
+        sample_rate: Output sample rate (default 16kHz for Whisper)
+        native_rate: Rate the mic stream is opened at (default 48kHz)
+        chunk_size: PortAudio frames per buffer (default ~16ms worth)
+        prefix_seconds: Length of the early prefix passed to on_prefix
+        on_prefix: Optional fn(prefix_audio) called mid-capture (see above)
     
     Returns:
-        numpy array of float32 audio samples
+        numpy array of float32 audio samples at sample_rate
     """
     try:
         import pyaudio
@@ -342,58 +658,438 @@ def record_audio_chunk(duration_seconds, sample_rate=SAMPLE_RATE_WHISPER):
         print("  brew install portaudio")
         sys.exit(1)
     
+    if chunk_size is None:
+        chunk_size = int(native_rate * REALTIME_BUFFER_SECONDS)
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    
+    # The duration needn't be a whole number of buffers — the
+    # callback trims the last buffer to exactly target_samples.
+    target_samples = int(round(native_rate * duration_seconds))
+    prefix_samples = None
+    if on_prefix is not None:
+        prefix_samples = min(int(round(native_rate * prefix_seconds)), target_samples)
+    
+    # PortAudio's callback writes each buffer straight into one
+    # preallocated int16 array. Only the callback thread advances
+    # write_idx, and the main thread only reads it after `done` is
+    # set, so no lock is needed.
+    audio_data = np.empty(target_samples, dtype=np.int16)
+    write_idx = 0
+    done = threading.Event()
+    prefix_ready = threading.Event()
+    
+    def on_audio(in_data, frame_count, time_info, status):
+        nonlocal write_idx
+        n = min(frame_count, target_samples - write_idx)
+        audio_data[write_idx:write_idx + n] = np.frombuffer(
+            in_data, dtype=np.int16, count=n
+        )
+        write_idx += n
+        if prefix_samples is not None and write_idx >= prefix_samples:
+            prefix_ready.set()
+        if write_idx >= target_samples:
+            done.set()
+            return (None, pyaudio.paComplete)
+        return (None, pyaudio.paContinue)
+    
     p = pyaudio.PyAudio()
     
+    # WHY callback mode: A blocking stream.read() loop runs Python
+    # once per buffer on the main thread and can drop frames if that
+    # thread stalls. In callback mode PortAudio drives the capture
+    # and the main thread just waits for the buffer to fill.
     stream = p.open(
         format=pyaudio.paInt16,
         channels=CHANNELS,
-        rate=sample_rate,
+        rate=native_rate,
         input=True,
-        frames_per_buffer=CHUNK_SIZE
+        frames_per_buffer=chunk_size,
+        stream_callback=on_audio
     )
     
-    frames = []
-    num_chunks = int(sample_rate / CHUNK_SIZE * duration_seconds)
+    try:
+        # The prefix is complete once prefix_ready is set; the
+        # callback only writes past it from then on.
+        if on_prefix is not None and prefix_ready.wait(timeout=prefix_seconds + 5.0):
+            on_prefix(resample_audio(
+                pcm16_to_float32(audio_data[:prefix_samples]), native_rate, sample_rate
+            ))
+        
+        # Generous timeout so a stalled device can't hang the benchmark
+        if not done.wait(timeout=duration_seconds + 5.0):
+            log_warn(f"Mic capture timed out after {write_idx}/{target_samples} samples")
+    finally:
+        stream.stop_stream()
+        stream.close()
+        p.terminate()
     
-    for _ in range(num_chunks):
-        data = stream.read(CHUNK_SIZE, exception_on_overflow=False)
-        frames.append(data)
+    audio_data = audio_data[:write_idx]
     
-    stream.stop_stream()
-    stream.close()
-    p.terminate()
+    # Convert int16 samples to float32 numpy array
+    audio_float = pcm16_to_float32(audio_data)
     
-    # Convert int16 bytes to float32 numpy array
-    audio_data = np.frombuffer(b''.join(frames), dtype=np.int16)
-    audio_float = audio_data.astype(np.float32) / 32768.0
+    return resample_audio(audio_float, native_rate, sample_rate)
+
+
+# Numba-compiled int16 -> float32 kernel. None = not built yet,
+# False = numba isn't installed (use the NumPy path).
+_PCM16_KERNEL = None
+
+
+def _get_pcm16_kernel():
+    """
+    Build (once) and return the Numba int16 -> float32 kernel,
+    or False if numba isn't available.
     
+    WHY lazy: Importing numba and compiling costs noticeable
+    time, so we only pay it the first time audio is converted.
+    cache=True persists the compiled code across runs.
+    """
+    global _PCM16_KERNEL
+    if _PCM16_KERNEL is None:
+        try:
+            from numba import njit, prange
+        except ImportError:
+            _PCM16_KERNEL = False
+        else:
+            @njit(parallel=True, fastmath=True, cache=True)
+            def _i16_to_f32(src, dst, scale):
+                for i in prange(src.size):
+                    dst[i] = src[i] * scale
+            _PCM16_KERNEL = _i16_to_f32
+    return _PCM16_KERNEL
+
+
+def pcm16_to_float32(audio_int16, out=None):
+    """
+    Convert int16 PCM samples to float32 normalized to [-1, 1].
+    
+    WHY a fused single pass: `astype(np.float32) / 32768.0`
+    makes two passes (cast, then divide) and allocates a temporary.
+    Writing the product straight into a preallocated float32 array
+    fuses the cast and scale into one pass, and a multiply by the
+    reciprocal is much cheaper per sample than a divide.
+    
+    When numba is installed, the loop is JIT-compiled to a
+    multithreaded SIMD kernel (see _get_pcm16_kernel); otherwise
+    np.multiply(..., out=) does the same fused pass.
+    
+    Pass `out` (a float32 array of the same length, e.g. a slice of
+    a preallocated buffer) to convert in place instead of allocating.
+    
+    Called by: record_audio_chunk()
+    """
+    import numpy as np
+    
+    audio_float = np.empty(audio_int16.size, dtype=np.float32) if out is None else out
+    scale = np.float32(1.0 / 32768.0)
+    
+    kernel = _get_pcm16_kernel()
+    if kernel:
+        kernel(audio_int16, audio_float, scale)
+    else:
+        np.multiply(audio_int16, scale, out=audio_float, casting='unsafe')
     return audio_float
 
 
+# torchaudio Resample modules, keyed by (from_rate, to_rate).
+# Building one computes the polyphase FIR kernel, so we do that
+# once per rate pair and reuse it for every recorded chunk.
+_RESAMPLERS = {}
+
+
+def _get_torchaudio_resampler(from_rate, to_rate):
+    """
+    Return a cached torchaudio Resample module, or None if
+    torchaudio isn't installed.
+    """
+    key = (from_rate, to_rate)
+    if key not in _RESAMPLERS:
+        try:
+            import torchaudio
+        except ImportError:
+            _RESAMPLERS[key] = None
+        else:
+            _RESAMPLERS[key] = torchaudio.transforms.Resample(
+                from_rate, to_rate,
+                lowpass_filter_width=16,
+                resampling_method="sinc_interp_kaiser",
+            )
+    return _RESAMPLERS[key]
+
+
+def resample_audio(audio_float32, from_rate, to_rate):
+    """
+    Resample a float32 audio array from one sample rate to another.
+    
+    WHY one-shot: Resampling the complete recording after capture
+    is far cheaper than letting PortAudio resample each buffer on
+    the real-time thread.
+    
+    WHY torchaudio first: Its Resample transform precomputes a
+    polyphase FIR kernel and runs it as a single conv1d, which is
+    roughly an order of magnitude faster than scipy/librosa. The
+    kernel is cached per rate pair (see _RESAMPLERS) so repeated
+    chunks only pay for the convolution. If torchaudio isn't
+    installed we fall back to scipy's FIR decimator.
+    
+    Called by: record_audio_chunk()
+    
+    Args:
+        audio_float32: numpy array of float32 samples at from_rate
+        from_rate: Sample rate of the input
+        to_rate: Desired output sample rate
+    
+    Returns:
+        numpy array of float32 samples at to_rate
+    """
+    if from_rate == to_rate:
+        return audio_float32
+    
+    import numpy as np
+    
+    resampler = _get_torchaudio_resampler(from_rate, to_rate)
+    if resampler is not None:
+        import torch
+        with torch.inference_mode():
+            resampled = resampler(torch.from_numpy(np.ascontiguousarray(audio_float32)))
+        return resampled.numpy()
+    
+    try:
+        from scipy import signal
+    except ImportError:
+        print(f"{C.RED}ERROR: torchaudio or scipy required to resample {from_rate}Hz -> {to_rate}Hz.{C.NC}")
+        print("  pip install torchaudio  (or: pip install scipy)")
+        sys.exit(1)
+    
+    if from_rate % to_rate == 0:
+        resampled = signal.decimate(
+            audio_float32, from_rate // to_rate, ftype='fir', zero_phase=True
+        )
+    else:
+        from math import gcd
+        g = gcd(from_rate, to_rate)
+        resampled = signal.resample_poly(audio_float32, to_rate // g, from_rate // g)
+    
+    return resampled.astype(np.float32, copy=False)
+
+
 def save_audio_to_wav(audio_float32, filepath, sample_rate=SAMPLE_RATE_WHISPER):
     """
     Save a float32 numpy audio array to a WAV file.
     
-    WHY: Some STT engines (mlx-whisper) only accept file paths,
-    not raw audio arrays. We need to write to a temp WAV file
-    and pass the path. This is a limitation of the mlx-whisper
-    API which doesn't support streaming audio buffers directly.
+    WHY: Some engines (whisper.cpp's CLI, whisper_mlx builds that
+    reject ndarrays) only accept file paths, so their chunk paths
+    write the audio to a temp WAV and pass the path. Engines that
+    take arrays (mlx-whisper) skip this entirely.
     
     Args:
         audio_float32: numpy array of float32 samples
         filepath: Output WAV file path
         sample_rate: Sample rate to write in the WAV header
+    
+    WHY soundfile: libsndfile does the float -> 16-bit PCM
+    quantization (with clipping) and the write in C, which is
+    much faster than the stdlib `wave` module for the longer
+    scenarios. If soundfile is missing we write the 44-byte
+    WAV header ourselves and dump the samples in one write.
+    """
+    try:
+        import soundfile as sf
+    except ImportError:
+        sf = None
+    
+    if sf is not None:
+        sf.write(filepath, audio_float32, sample_rate, subtype='PCM_16')
+        return
+    
+    audio_int16 = _float32_to_pcm16(audio_float32)
+    
+    with open(filepath, 'wb') as f:
+        f.write(_wav_header(audio_int16.size // CHANNELS, sample_rate, CHANNELS, 16))
+        audio_int16.tofile(f)
+
+
+def audio_to_wav_bytes(audio_float32, sample_rate=SAMPLE_RATE_WHISPER):
+    """
+    Encode a float32 numpy audio array as 16-bit PCM WAV bytes,
+    entirely in memory.
+    
+    WHY: Recorded chunks used to go save_audio_to_wav -> temp file
+    -> whisper-cli re-reading and re-parsing it. Engines that can
+    take a WAV over a pipe or HTTP body (whisper-cli `-f -`,
+    whisper-server) get these bytes directly instead, so there's
+    no file-system round trip per chunk.
+    """
+    audio_int16 = _float32_to_pcm16(audio_float32)
+    header = _wav_header(audio_int16.size // CHANNELS, sample_rate, CHANNELS, 16)
+    return header + audio_int16.tobytes()
+
+
+def _float32_to_pcm16(audio_float32):
+    """
+    Convert float32 [-1, 1] samples to little-endian int16. Scale,
+    round and clip in one scratch buffer, then narrow it.
     """
     import numpy as np
     
-    # Convert float32 [-1, 1] back to int16 for WAV format
-    audio_int16 = (audio_float32 * 32767).astype(np.int16)
+    scaled = np.empty(audio_float32.size, dtype=np.float32)
+    np.multiply(audio_float32, np.float32(32767.0), out=scaled)
+    np.rint(scaled, out=scaled)
+    np.clip(scaled, -32768, 32767, out=scaled)
+    return scaled.astype('<i2', copy=False)
+
+
+def _wav_header(num_frames, sample_rate, channels, bits_per_sample):
+    """
+    Build the canonical 44-byte RIFF/WAVE header for PCM data.
     
-    with wave.open(filepath, 'w') as wf:
-        wf.setnchannels(CHANNELS)
-        wf.setsampwidth(2)  # 16-bit = 2 bytes
-        wf.setframerate(sample_rate)
-        wf.writeframes(audio_int16.tobytes())
+    WHY by hand: The layout is fixed for plain PCM, so one
+    struct.pack replaces the stdlib `wave` writer entirely.
+    """
+    block_align = channels * bits_per_sample // 8
+    data_size = num_frames * block_align
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + data_size, b'WAVE',
+        b'fmt ', 16, 1, channels, sample_rate,
+        sample_rate * block_align, block_align, bits_per_sample,
+        b'data', data_size,
+    )
+
+
+
+def wav_duration(path):
+    """
+    Return the duration in seconds of a PCM WAV file.
+    
+    WHY not `wave`: the file benchmarks only need the length, and
+    for our 16-bit mono files that's two header fields. Reading
+    them with struct (see _wav_layout) skips building a
+    wave.Wave_read per scenario.
+    """
+    with open(path, 'rb') as f:
+        _, byte_rate, _, data_size = _wav_layout(f, path)
+    return data_size / byte_rate if byte_rate else 0.0
+
+
+def read_wav_float32(path):
+    """
+    Read a 16-bit PCM WAV into a float32 array in [-1, 1].
+    Returns (audio_float32, sample_rate).
+    
+    WHY: `wave.readframes` + `np.frombuffer` + `astype / 32768`
+    copies the samples three times. soundfile (libsndfile)
+    decodes straight to float32 in C; without it we read the
+    int16 samples with one np.fromfile and convert them in a
+    single fused pass (pcm16_to_float32).
+    """
+    try:
+        import soundfile as sf
+    except ImportError:
+        sf = None
+    
+    if sf is not None:
+        audio, sample_rate = sf.read(path, dtype='float32')
+        return audio, sample_rate
+    
+    import numpy as np
+    
+    with open(path, 'rb') as f:
+        sample_rate, _, data_offset, data_size = _wav_layout(f, path)
+        f.seek(data_offset)
+        audio_int16 = np.fromfile(f, dtype='<i2', count=data_size // 2)
+    return pcm16_to_float32(audio_int16), sample_rate
+
+
+def _wav_layout(f, path):
+    """
+    Return (sample_rate, byte_rate, data_offset, data_size) for an
+    open WAV file.
+    
+    Reads the canonical 44-byte header. `say` sometimes puts extra
+    chunks (e.g. Apple's FLLR padding) before `data`, so if the
+    data chunk isn't where the canonical layout says, we walk the
+    chunk list to find it.
+    """
+    header = f.read(44)
+    sample_rate, byte_rate = struct.unpack_from('<II', header, 24)
+    if header[36:40] == b'data':
+        return sample_rate, byte_rate, 44, struct.unpack_from('<I', header, 40)[0]
+    
+    # fmt chunk starts at 12; hop from chunk to chunk
+    f.seek(12)
+    while True:
+        chunk = f.read(8)
+        if len(chunk) < 8:
+            raise ValueError(f"No data chunk in WAV: {path}")
+        chunk_id, chunk_size = struct.unpack('<4sI', chunk)
+        if chunk_id == b'data':
+            return sample_rate, byte_rate, f.tell(), chunk_size
+        f.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
+
+
+# Path of the one-second silent warmup WAV, once written.
+_WARMUP_WAV = None
+
+
+def get_warmup_wav():
+    """
+    Return the path to a shared one-second silent 16kHz WAV.
+    
+    WHY: every engine's warmup() needs a throwaway file to push
+    through the model, and main() builds ~10 engines per run.
+    Writing it once per process (and removing it at exit) saves
+    the repeated writes and keeps engines from racing on the
+    same name in TMP_DIR. All-zero PCM needs no numpy at all.
+    """
+    global _WARMUP_WAV
+    if _WARMUP_WAV is None:
+        _ensure_dir(TMP_DIR)
+        path = str(TMP_DIR / f"shared_warmup_{os.getpid()}.wav")
+        with open(path, 'wb') as f:
+            f.write(_wav_header(SAMPLE_RATE_WHISPER, SAMPLE_RATE_WHISPER, CHANNELS, 16))
+            f.write(bytes(SAMPLE_RATE_WHISPER * 2))
+        atexit.register(_remove_quietly, path)
+        _WARMUP_WAV = path
+    return _WARMUP_WAV
+
+
+def _remove_quietly(path):
+    """os.unlink() that ignores an already-missing file."""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+# ============================================================
+# MLX MEMORY
+# ============================================================
+
+def release_mlx_memory():
+    """
+    Collect dropped model objects and hand MLX's cached Metal
+    buffers back to the OS.
+    
+    WHY: The MLX benchmarks load several models back to back
+    (tiny -> base -> distil-large). MLX's allocator keeps freed
+    buffers cached for reuse, so without this the previous
+    model's memory is still held while the next one loads, and
+    on a 16GB Mac the large models end up in swap. Call it after
+    dropping the last reference to an engine/model. No-op when
+    MLX isn't installed.
+    """
+    import gc
+    gc.collect()
+    try:
+        import mlx.core as mx
+    except ImportError:
+        return
+    # mx.clear_cache() replaced mx.metal.clear_cache() in newer MLX
+    clear_cache = getattr(mx, "clear_cache", None) or mx.metal.clear_cache
+    clear_cache()
 
 
 # ============================================================
@@ -413,9 +1109,23 @@ class MarkdownResultWriter:
     or be interrupted. By writing results incrementally, we
     don't lose partial results. This is the same pattern
     used in run-stt-scenarios.sh.
+    
+    WHY one open file handle: Reopening the file for every
+    row meant dozens of open()/close() syscalls per run. We
+    keep a single handle open and flush it at logical section
+    boundaries (new section, end of table), so at most the
+    section in progress is lost if the process dies. The
+    handle is closed at exit, or use the writer as a context
+    manager to close it explicitly.
+    
+    incremental=False trades that safety for zero disk I/O while
+    the benchmark runs: everything goes to an in-memory buffer
+    that is written out in one go by close() (still called at
+    exit, so a Python exception doesn't lose the results — only
+    a hard kill does).
     """
     
-    def __init__(self, filepath, title, engine_name):
+    def __init__(self, filepath, title, engine_name, incremental=True):
         """
         Initialize the result writer.
         
@@ -423,29 +1133,72 @@ class MarkdownResultWriter:
             filepath: Path to the markdown file to write
             title: Document title
             engine_name: Name of the STT engine being tested
+            incremental: Flush to disk as we go (default) or
+                buffer in memory and write once on close()
         """
         self.filepath = filepath
         self.engine_name = engine_name
+        self.incremental = incremental
         
         # Ensure the results directory exists
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        _ensure_dir(os.path.dirname(filepath))
         
-        # Write the header immediately
-        with open(filepath, 'w') as f:
-            f.write(f"# {title}\n\n")
-            f.write(f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"**Engine**: {engine_name}\n")
-            f.write(f"**Platform**: macOS on Apple Silicon\n")
-            f.write(f"**Goal**: Evaluate real-time transcription capability via Neural Engine / MLX\n\n")
-            f.write("---\n\n")
+        # Write the header immediately (to the buffer if not incremental)
+        self._fh = open(filepath, 'w') if incremental else io.StringIO()
+        atexit.register(self.close)
+        self._fh.write(f"# {title}\n\n")
+        self._fh.write(f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        self._fh.write(f"**Engine**: {engine_name}\n")
+        self._fh.write(f"**Platform**: macOS on Apple Silicon\n")
+        self._fh.write(f"**Goal**: Evaluate real-time transcription capability via Neural Engine / MLX\n\n")
+        self._fh.write("---\n\n")
+        self.flush()
+    
+    @classmethod
+    def fragment(cls):
+        """
+        In-memory writer with no header and no file, for a section
+        built elsewhere (e.g. in a worker process). Read it back with
+        getvalue() and append() it to the real writer.
+        """
+        self = cls.__new__(cls)
+        self.filepath = None
+        self.engine_name = None
+        self.incremental = False
+        self._fh = io.StringIO()
+        return self
+    
+    def getvalue(self):
+        """Text written so far (in-memory writers only)."""
+        return self._fh.getvalue()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
     
     def append(self, text):
-        """Append raw text to the markdown file."""
-        with open(self.filepath, 'a') as f:
-            f.write(text)
+        """Append raw text to the markdown file (buffered)."""
+        self._fh.write(text)
+    
+    def flush(self):
+        """Push buffered text to disk."""
+        if not self._fh.closed:
+            self._fh.flush()
+    
+    def close(self):
+        """Flush and close the file. Safe to call more than once."""
+        if self._fh.closed:
+            return
+        if not self.incremental and self.filepath:
+            with open(self.filepath, 'w') as f:
+                f.write(self._fh.getvalue())
+        self._fh.close()
     
     def add_section(self, title, level=2):
-        """Add a section header."""
+        """Add a section header. Flushes the previous section first."""
+        self.flush()
         prefix = "#" * level
         self.append(f"\n{prefix} {title}\n\n")
     
@@ -466,13 +1219,72 @@ class MarkdownResultWriter:
         """Add a markdown table data row."""
         self.append("| " + " | ".join(str(c) for c in cols) + " |\n")
     
+    def add_table_rows(self, rows):
+        """
+        Add several table rows in one write.
+        
+        For loops that collect a table's rows first (e.g. while
+        work runs in other threads) and emit them together, so
+        rows from one table can't interleave with other output.
+        """
+        self.append("".join(
+            "| " + " | ".join(str(c) for c in cols) + " |\n" for cols in rows
+        ))
+    
     def add_code(self, text, lang=""):
         """Add a code block."""
         self.append(f"```{lang}\n{text}\n```\n\n")
     
     def add_newline(self):
-        """Add a blank line."""
+        """Add a blank line. Ends a table, so flush it to disk."""
         self.append("\n")
+        self.flush()
+
+
+class BenchmarkResultCache:
+    """
+    On-disk JSON memo of per-scenario benchmark results, so a
+    rerun can skip scenarios that were already measured.
+    
+    WHY: When iterating on one model or config, re-rendering and
+    re-transcribing every other config × scenario made each run
+    a batch job. A result depends only on the config and the
+    scenario (text + rate), so we key on a hash of those and
+    keep whatever the caller stored (e.g. [text, inference_time,
+    audio_duration]). Pass enabled=False (--force) to ignore the
+    cache and re-measure; new results are still written back.
+    
+    Each put() rewrites the file (temp + rename), so an
+    interrupted run keeps everything measured up to that point.
+    """
+    
+    def __init__(self, filepath, enabled=True):
+        self.filepath = str(filepath)
+        self.enabled = enabled
+        self._data = {}
+        try:
+            with open(self.filepath) as f:
+                self._data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+    
+    @staticmethod
+    def key(*parts):
+        """Stable cache key for a config + scenario description."""
+        return hashlib.sha1("|".join(map(str, parts)).encode("utf-8")).hexdigest()
+    
+    def get(self, key):
+        """Cached value for key, or None (always None when disabled)."""
+        return self._data.get(key) if self.enabled else None
+    
+    def put(self, key, value):
+        """Store a JSON-serializable value and persist immediately."""
+        self._data[key] = value
+        _ensure_dir(os.path.dirname(self.filepath))
+        tmp_path = f"{self.filepath}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self._data, f, indent=1)
+        os.replace(tmp_path, self.filepath)
 
 
 # ============================================================
@@ -499,6 +1311,20 @@ class BenchmarkScenario:
         self.description = description
         self.pre_speech_delay = pre_speech_delay
         self.post_speech_wait = post_speech_wait
+        self._ref_tokens = None
+    
+    def ref_tokens(self):
+        """
+        The scenario text as a tuple of cleaned words, tokenized on
+        first use (a tuple so it can key the metric cache).
+        
+        WHY: Every engine scores every scenario against the same
+        expected text. Passing these to word_accuracy() and
+        word_error_rate() skips re-tokenizing it on each call.
+        """
+        if self._ref_tokens is None:
+            self._ref_tokens = tuple(_clean(self.text))
+        return self._ref_tokens
 
 
 # ============================================================
@@ -609,6 +1435,13 @@ def log_info(msg):
 # ENVIRONMENT CHECKS
 # ============================================================
 
+# Cached results of the checks below. None = not checked yet.
+# Engine scripts call these more than once per run, and
+# PyAudio() enumerates every CoreAudio device (50-200ms).
+_PYAUDIO_OK = None
+_NUMPY_OK = None
+
+
 def check_pyaudio_available():
     """
     Check if PyAudio is installed and working.
@@ -617,39 +1450,52 @@ def check_pyaudio_available():
     WHY: PyAudio requires portaudio which must be installed
     via brew on macOS. If it's missing, we want to give a
     clear error message rather than a confusing import error.
+    
+    The result is cached, so the error message is printed
+    once and later calls return immediately.
     """
+    global _PYAUDIO_OK
+    if _PYAUDIO_OK is not None:
+        return _PYAUDIO_OK
+    
     try:
         import pyaudio
         # Try to actually instantiate it to check portaudio
         p = pyaudio.PyAudio()
         p.terminate()
-        return True
+        _PYAUDIO_OK = True
     except ImportError:
         print(f"{C.RED}PyAudio not installed.{C.NC}")
         print(f"  Run: pip install pyaudio")
         print(f"  Also: brew install portaudio")
-        return False
+        _PYAUDIO_OK = False
     except Exception as e:
         print(f"{C.RED}PyAudio error: {e}{C.NC}")
         print(f"  Try: brew install portaudio && pip install pyaudio")
-        return False
+        _PYAUDIO_OK = False
+    return _PYAUDIO_OK
 
 
 def check_numpy_available():
-    """Check if numpy is installed."""
+    """Check if numpy is installed (cached after the first call)."""
+    global _NUMPY_OK
+    if _NUMPY_OK is not None:
+        return _NUMPY_OK
+    
     try:
         import numpy
-        return True
+        _NUMPY_OK = True
     except ImportError:
         print(f"{C.RED}numpy not installed. Run: pip install numpy{C.NC}")
-        return False
+        _NUMPY_OK = False
+    return _NUMPY_OK
 
 
 def ensure_directories():
     """Create necessary directories for test artifacts."""
-    os.makedirs(RESULTS_DIR, exist_ok=True)
-    os.makedirs(MODELS_DIR, exist_ok=True)
-    os.makedirs(TMP_DIR, exist_ok=True)
+    _ensure_dir(RESULTS_DIR)
+    _ensure_dir(MODELS_DIR)
+    _ensure_dir(TMP_DIR)
 
 
 # ============================================================
@@ -663,22 +1509,33 @@ def announce_completion(engine_name, summary):
     WHY: The user has accessibility needs and requested
     verbal summaries of test completions. We use the same
     low-volume approach from our .cursorrules — render to
-    AIFF then play at 30% volume so it doesn't interfere
+    a file then play at 30% volume so it doesn't interfere
     with any calls or other audio.
+    
+    The render goes straight to WAV (one `say` call, no AIFF
+    step) at a per-process path so concurrent runs don't
+    clobber each other's announcement file.
     """
+    wav_path = f"/tmp/neural_stt_announce_{os.getpid()}.wav"
     try:
         msg = f"Neural Engine S T T benchmark for {engine_name} complete. {summary}"
-        aiff_path = "/tmp/neural_stt_announce.aiff"
         subprocess.run(
-            ["/usr/bin/say", "-o", aiff_path, msg],
-            capture_output=True, timeout=30
+            ["/usr/bin/say", "-o", wav_path, "--file-format=WAVE", msg],
+            **_QUIET, timeout=30
         )
-        subprocess.run(
-            ["afplay", "-v", "0.3", aiff_path],
-            capture_output=True, timeout=30
+        proc = subprocess.Popen(
+            ["afplay", "-v", "0.3", wav_path],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
         )
+        try:
+            proc.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            proc.kill()
     except Exception:
         pass  # Non-critical — don't fail tests over announcement
+    finally:
+        if os.path.exists(wav_path):
+            os.unlink(wav_path)
 
 
 if __name__ == "__main__":
@@ -700,6 +1557,7 @@ if __name__ == "__main__":
     assert word_accuracy("hello world", "hello world") == 1.0
     assert word_accuracy("hello world", "hello") == 0.5
     assert word_error_rate("hello world", "hello world") == 0.0
+    assert word_accuracy_and_wer("hello world", "hello there") == (0.5, 0.5)
     print(f"  {C.GREEN}Accuracy functions OK{C.NC}")
     
     print(f"\n{C.GREEN}All self-checks passed.{C.NC}")
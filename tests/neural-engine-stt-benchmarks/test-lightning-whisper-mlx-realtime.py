@@ -43,15 +43,23 @@ batch_size and quantization control):
 
 RUN:
   python3 tests/neural-engine-stt-benchmarks/test-lightning-whisper-mlx-realtime.py
+  python3 tests/neural-engine-stt-benchmarks/test-lightning-whisper-mlx-realtime.py --force   # ignore cached results
 
 CREATED: 2026-02-07 from research showing LightningWhisperMLX
 achieves 10x speedup over whisper.cpp on Apple Silicon.
 ============================================================
 """
 
+import argparse
+import atexit
 import os
 import sys
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from importlib import metadata
+from typing import Optional
 
 # Add parent path so we can import shared utils
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -59,54 +67,123 @@ sys.path.insert(0, SCRIPT_DIR)
 
 from shared_test_utils import (
     C, log, log_section, log_pass, log_fail, log_warn, log_info,
-    say_and_wait, say_to_wav_file, say_async,
-    word_accuracy, word_error_rate,
-    record_audio_chunk, save_audio_to_wav,
-    MarkdownResultWriter, STANDARD_SCENARIOS,
+    say_async, iter_scenario_wavs, prerender_scenario_wavs,
+    word_accuracy, word_accuracy_and_wer,
+    record_audio_chunk, save_audio_to_wav, get_warmup_wav, wav_duration,
+    MarkdownResultWriter, BenchmarkResultCache, STANDARD_SCENARIOS,
     RESULTS_DIR, TMP_DIR, SAMPLE_RATE_WHISPER,
-    ensure_directories, check_pyaudio_available, check_numpy_available,
-    announce_completion, POST_SPEECH_WAIT
+    ensure_directories, prewarm_say, check_pyaudio_available, check_numpy_available,
+    announce_completion, release_mlx_memory
 )
 
+# Imported once here instead of inside warmup() and the per-chunk
+# transcribe path. Both stay optional at import time so main() can
+# print install instructions rather than a traceback.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from whisper_mlx import LightningWhisperMLX
+except ImportError:
+    LightningWhisperMLX = None
+
 
 # ============================================================
 # CONFIGURATION
 # ============================================================
 
+@dataclass(slots=True, frozen=True)
+class LightningConfig:
+    """
+    One LightningWhisperMLX configuration to benchmark.
+    
+    WHY a dataclass (vs the old 5-tuples): call sites read
+    fields by name (cfg.batch_size) instead of unpacking by
+    position, so adding a field can't silently shift the rest.
+    """
+    model: str                 # Short model name, e.g. "tiny.en"
+    batch_size: int            # Tokens decoded in parallel (higher = faster, more RAM)
+    quant: Optional[str]       # None (full precision) or "4bit"
+    display_name: str
+    description: str
+
+
 # Model configurations to test.
-# Each is (model_name, batch_size, quant, display_name, description)
 # batch_size controls how many tokens are decoded in parallel.
 # Higher batch_size = faster but more memory.
 # quant can be None (full precision) or "4bit" (quantized).
 LIGHTNING_CONFIGS = [
-    (
-        "tiny.en", 32, None,
-        "Tiny (batch=32, full precision)",
-        "Smallest model with maximum batching. Should be extremely fast. "
-        "This tests the lower bound of inference time."
+    LightningConfig(
+        model="tiny.en", batch_size=32, quant=None,
+        display_name="Tiny (batch=32, full precision)",
+        description="Smallest model with maximum batching. Should be extremely fast. "
+                    "This tests the lower bound of inference time."
     ),
-    (
-        "base.en", 24, None,
-        "Base (batch=24, full precision)",
-        "Small model with high batching. Good speed/accuracy balance. "
-        "Comparable to our existing ggml-base.en whisper.cpp model."
+    LightningConfig(
+        model="tiny.en", batch_size=32, quant="4bit",
+        display_name="Tiny (batch=32, 4-bit quantized)",
+        description="Tiny with 4-bit weights. Decoding is weight-bandwidth bound, "
+                    "so this should decode noticeably faster than full precision."
     ),
-    (
-        "distil-large-v3", 12, None,
-        "Distil-Large-V3 (batch=12, full precision)",
-        "Large distilled model with moderate batching. Best accuracy "
-        "at this speed tier. May need 8-16GB RAM."
+    LightningConfig(
+        model="base.en", batch_size=24, quant=None,
+        display_name="Base (batch=24, full precision)",
+        description="Small model with high batching. Good speed/accuracy balance. "
+                    "Comparable to our existing ggml-base.en whisper.cpp model."
     ),
-    (
-        "distil-large-v3", 12, "4bit",
-        "Distil-Large-V3 (batch=12, 4-bit quantized)",
-        "Same large model but quantized to 4-bit. Uses ~50% less memory "
-        "with minimal accuracy loss. Good for machines with 8GB RAM."
+    LightningConfig(
+        model="base.en", batch_size=24, quant="4bit",
+        display_name="Base (batch=24, 4-bit quantized)",
+        description="Base with 4-bit weights. Compare against full-precision base "
+                    "to see whether the speedup costs any accuracy."
+    ),
+    LightningConfig(
+        model="distil-large-v3", batch_size=12, quant=None,
+        display_name="Distil-Large-V3 (batch=12, full precision)",
+        description="Large distilled model with moderate batching. Best accuracy "
+                    "at this speed tier. May need 8-16GB RAM."
+    ),
+    LightningConfig(
+        model="distil-large-v3", batch_size=12, quant="4bit",
+        display_name="Distil-Large-V3 (batch=12, 4-bit quantized)",
+        description="Same large model but quantized to 4-bit. Uses ~50% less memory "
+                    "with minimal accuracy loss. Good for machines with 8GB RAM."
     ),
 ]
 
+# Chunked realtime only runs the small models, and always with
+# 4-bit weights. Token-at-a-time decoding is bound by weight
+# bandwidth, so halving the bytes per step matters most when the
+# whole chunk has to finish inside its own duration (RTF < 1).
+REALTIME_MODELS = ("tiny.en", "base.en")
+REALTIME_QUANT = "4bit"
+
 RESULTS_FILE = os.path.join(RESULTS_DIR, "lightning-whisper-mlx-benchmark-results.md")
 
+# Per-scenario results from earlier runs (see BenchmarkResultCache)
+CACHE_FILE = os.path.join(RESULTS_DIR, "bench_cache.json")
+
+
+def _installed_versions():
+    """
+    "vayu-whisper=X|mlx=Y" for the installed packages, for the
+    result cache key.
+    
+    WHY: a cached timing is only valid for the code that produced
+    it. The library pins which weights each model name downloads,
+    and MLX does the actual compute, so an upgrade of either must
+    miss the cache instead of silently reusing old numbers.
+    """
+    versions = []
+    for dist in ("vayu-whisper", "mlx"):
+        try:
+            versions.append(f"{dist}={metadata.version(dist)}")
+        except metadata.PackageNotFoundError:
+            versions.append(f"{dist}=unknown")
+    return "|".join(versions)
+
 
 # ============================================================
 # LIGHTNING-WHISPER-MLX ENGINE WRAPPER
@@ -142,6 +219,14 @@ class LightningWhisperEngine:
         self.quant = quant
         self.whisper = None
         self.load_time = None
+        # Whether whisper.transcribe() takes an ndarray directly.
+        # Probed in warmup(); until then assume it doesn't.
+        self._supports_ndarray = False
+        # Temp WAV for the no-ndarray fallback. One path per engine,
+        # overwritten per chunk and removed at exit (see
+        # transcribe_audio_array).
+        self._tmp_wav = os.path.join(TMP_DIR, f"chunk_{type(self).__name__}_{id(self)}.wav")
+        self._tmp_wav_registered = False
     
     def warmup(self):
         """
@@ -151,9 +236,7 @@ class LightningWhisperEngine:
         the model. First inference may also trigger compilation.
         We measure both to report cold-start time.
         """
-        try:
-            from whisper_mlx import LightningWhisperMLX
-        except ImportError:
+        if LightningWhisperMLX is None:
             log_fail("vayu-whisper not installed. Run: pip install vayu-whisper")
             log(f"  Then: python -m whisper_mlx.assets.download_assets")
             return False
@@ -171,20 +254,17 @@ class LightningWhisperEngine:
             
             self.whisper = LightningWhisperMLX(**kwargs)
             
-            # Warmup inference with a tiny silent file
-            warmup_path = os.path.join(TMP_DIR, "lightning_warmup.wav")
-            import numpy as np
+            # Warmup inference on 1s of in-memory silence. That
+            # doubles as the ndarray probe; only if the array is
+            # rejected do we warm up from the shared silent WAV.
             silence = np.zeros(SAMPLE_RATE_WHISPER, dtype=np.float32)
-            save_audio_to_wav(silence, warmup_path)
-            
-            self.whisper.transcribe(warmup_path, language="en")
+            self._supports_ndarray = self._probe_ndarray(silence)
+            if not self._supports_ndarray:
+                self.whisper.transcribe(get_warmup_wav(), language="en")
             
             self.load_time = time.time() - start
             log(f"  Model ready in {self.load_time:.1f}s")
             
-            if os.path.exists(warmup_path):
-                os.unlink(warmup_path)
-            
             return True
             
         except Exception as e:
@@ -193,6 +273,24 @@ class LightningWhisperEngine:
             traceback.print_exc()
             return False
     
+    def _probe_ndarray(self, silence):
+        """
+        Check whether this whisper_mlx build accepts a numpy array
+        in transcribe().
+        
+        WHY A PROBE: upstream lightning-whisper-mlx forwards the
+        argument to its transcribe_audio(), which takes str or
+        ndarray, but the vayu-whisper fork has changed signatures
+        between releases. Trying it once on silence is cheaper and
+        more reliable than inspecting signatures.
+        """
+        try:
+            self.whisper.transcribe(silence, language="en")
+            return True
+        except Exception:
+            log_warn("  whisper_mlx rejected ndarray input — using temp WAV for chunks")
+            return False
+    
     def transcribe_file(self, wav_path):
         """
         Transcribe a WAV file. Returns (text, inference_time).
@@ -200,70 +298,110 @@ class LightningWhisperEngine:
         Uses the LightningWhisperMLX.transcribe() method which
         internally handles batched decoding for speed.
         """
+        return self._transcribe(wav_path)
+    
+    def transcribe_audio_array(self, audio_float32):
+        """
+        Transcribe from a 16kHz float32 numpy array.
+        
+        Passes the array straight to the model when the warmup probe
+        says that works, skipping the WAV write + ffmpeg decode per
+        chunk. Otherwise falls back to the temp-file workaround.
+        """
+        if self._supports_ndarray:
+            audio = np.ascontiguousarray(audio_float32, dtype=np.float32).ravel()
+            return self._transcribe(audio)
+        
+        # Rewrite the same file every chunk rather than create +
+        # unlink a new one, keeping directory churn out of the loop
+        if not self._tmp_wav_registered:
+            atexit.register(self._remove_tmp_wav)
+            self._tmp_wav_registered = True
+        save_audio_to_wav(audio_float32, self._tmp_wav)
+        return self._transcribe(self._tmp_wav)
+    
+    def _remove_tmp_wav(self):
+        """atexit hook: delete this engine's chunk WAV if it exists."""
+        if os.path.exists(self._tmp_wav):
+            os.unlink(self._tmp_wav)
+    
+    def _transcribe(self, audio):
+        """Time one whisper.transcribe() call on a path or ndarray."""
         if not self.whisper:
             return "ERROR: Model not loaded", 0
         
         start = time.time()
         result = self.whisper.transcribe(
-            wav_path,
+            audio,
             language="en"
         )
         inference_time = time.time() - start
         
         text = result.get("text", "").strip()
         return text, inference_time
-    
-    def transcribe_audio_array(self, audio_float32):
-        """
-        Transcribe from a numpy array by saving to temp file.
-        Same file-based workaround as mlx-whisper.
-        """
-        tmp_path = os.path.join(TMP_DIR, f"lightning_chunk_{os.getpid()}.wav")
-        save_audio_to_wav(audio_float32, tmp_path)
-        
-        try:
-            return self.transcribe_file(tmp_path)
-        finally:
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
 
 
 # ============================================================
 # TEST SCENARIOS
 # ============================================================
 
-def run_file_benchmark(engine, md, display_name, scenarios):
+def run_file_benchmark(engine, md, display_name, scenarios, cache, precomputed_wavs=None):
     """
     File-based transcription benchmark — same approach as
     mlx-whisper test for direct comparison.
     
     Pre-renders speech to WAV via `say`, then measures pure
     inference time for each model configuration.
+    
+    Scenarios already in `cache` for this config (and the same
+    installed library versions) are reported from the cache
+    without rendering or transcribing them, marked "(cached)".
+    precomputed_wavs ({scenario.name: wav_path}, from
+    prerender_scenario_wavs) skips rendering entirely; without
+    it the misses are rendered ahead in the background.
     """
     md.add_table_header([
         "Scenario", "Expected", "Got", "Accuracy",
         "WER", "Inference", "Audio Dur", "RTF"
     ])
     
+    versions = _installed_versions()
+    
+    def cache_key(scenario):
+        return cache.key(engine.model_name, engine.batch_size, engine.quant,
+                         versions, scenario.text, scenario.rate)
+    
+    # Only the misses need audio, in scenario order
+    misses = [s for s in scenarios if cache.get(cache_key(s)) is None]
+    if precomputed_wavs is not None:
+        pending = ((s, precomputed_wavs[s.name]) for s in misses)
+    else:
+        pending = iter_scenario_wavs(misses)
+    
+    rows = []
+    num_cached = 0
     for scenario in scenarios:
         log(f"\n  Testing: {scenario.name}")
         
-        wav_path = os.path.join(TMP_DIR, f"lightning_bench_{scenario.name.replace(' ', '_')}.wav")
-        say_to_wav_file(scenario.text, wav_path, rate=scenario.rate)
-        
-        import wave
-        with wave.open(wav_path, 'r') as wf:
-            audio_duration = wf.getnframes() / wf.getframerate()
-        
-        try:
-            text, inference_time = engine.transcribe_file(wav_path)
-        except Exception as e:
-            log_fail(f"Error: {e}")
-            text = f"ERROR: {e}"
-            inference_time = 0
+        key = cache_key(scenario)
+        cached = cache.get(key)
+        if cached is not None:
+            num_cached += 1
+            text, inference_time, audio_duration = cached
+            log_info("    cached result (pass --force to re-run)")
+        else:
+            _, wav_path = next(pending)
+            audio_duration = wav_duration(wav_path)
+            
+            try:
+                text, inference_time = engine.transcribe_file(wav_path)
+                cache.put(key, [text, inference_time, audio_duration])
+            except Exception as e:
+                log_fail(f"Error: {e}")
+                text = f"ERROR: {e}"
+                inference_time = 0
         
-        acc = word_accuracy(scenario.text, text)
-        wer = word_error_rate(scenario.text, text)
+        acc, wer = word_accuracy_and_wer(scenario.ref_tokens(), text)
         rtf = inference_time / audio_duration if audio_duration > 0 else 999
         
         acc_color = C.GREEN if acc >= 0.8 else C.YELLOW if acc >= 0.5 else C.RED
@@ -272,8 +410,8 @@ def run_file_benchmark(engine, md, display_name, scenarios):
             f"{rtf_color}RTF={rtf:.2f}{C.NC} | "
             f"'{text[:50]}'")
         
-        md.add_table_row([
-            scenario.name,
+        rows.append([
+            f"{scenario.name} (cached)" if cached is not None else scenario.name,
             f"`{scenario.text[:40]}{'...' if len(scenario.text) > 40 else ''}`",
             f"`{text[:40]}{'...' if len(text) > 40 else ''}`",
             f"{acc*100:.0f}%",
@@ -282,18 +420,34 @@ def run_file_benchmark(engine, md, display_name, scenarios):
             f"{audio_duration:.1f}s",
             f"{rtf:.2f}"
         ])
-        
-        if os.path.exists(wav_path):
-            os.unlink(wav_path)
     
+    md.add_table_rows(rows)
     md.add_newline()
+    if num_cached:
+        md.add_text(
+            f"{num_cached} row(s) marked (cached) were measured in an earlier run with the "
+            f"same config and library versions ({versions}); rerun with `--force` to re-measure."
+        )
 
 
-def run_chunked_realtime(engine, md, chunk_duration=3.0):
+def run_chunked_realtime(engine, md, chunk_duration=3.0, max_pending=2):
     """
     Chunked real-time simulation — same approach as mlx-whisper
     test. Records audio from mic while say plays, transcribes
     the chunk, measures total latency.
+    
+    PIPELINED: Transcription runs on a single worker thread, so
+    while phrase N is being transcribed the main thread is already
+    speaking and recording phrase N+1 — the way a streaming app
+    keeps capturing while the model works (chunk_duration plays
+    the role of Whisper-Streaming's MinChunkSize). max_pending caps
+    how many captured chunks may still be waiting on the model;
+    only when more than that are unfinished does capture wait for
+    the oldest. Each phrase is captured for chunk_duration + 2s,
+    and the tiny/base models run here transcribe a chunk much
+    faster than that, so with three phrases the cap is not hit in
+    practice; it only bounds the backlog if inference falls behind. Total Latency is speech
+    start to that phrase's transcript being ready.
     """
     md.add_section(f"Chunked Realtime ({chunk_duration}s chunks)")
     md.add_table_header([
@@ -306,39 +460,74 @@ def run_chunked_realtime(engine, md, chunk_duration=3.0):
         ("The quick brown fox jumps over the lazy dog", 140),
     ]
     
-    for text, rate in test_phrases:
-        log(f"  Chunked: '{text}' ({chunk_duration}s)")
-        
-        total_record_time = chunk_duration + 2.0
-        speech_start = time.time()
-        
-        say_proc = say_async(text, rate=rate)
-        
+    def timed_transcribe(audio):
+        transcribed, inference_time = engine.transcribe_audio_array(audio)
+        return transcribed, inference_time, time.time()
+    
+    rows = []
+    
+    def finish(text, speech_start, future):
+        """Wait for one phrase's transcript and record its row."""
         try:
-            audio = record_audio_chunk(total_record_time, SAMPLE_RATE_WHISPER)
-            say_proc.wait(timeout=30)
-            transcribed, inference_time = engine.transcribe_audio_array(audio)
+            if future is None:
+                raise RuntimeError("capture failed")
+            transcribed, inference_time, done_at = future.result()
+            total_latency = done_at - speech_start
         except Exception as e:
             log_fail(f"Error: {e}")
             transcribed = f"ERROR"
             inference_time = 0
-            say_proc.wait(timeout=10)
+            total_latency = time.time() - speech_start
         
-        total_latency = time.time() - speech_start
         acc = word_accuracy(text, transcribed)
         
         log(f"    {acc*100:.0f}% | Latency: {total_latency:.1f}s | '{transcribed[:50]}'")
         
-        md.add_table_row([
+        rows.append([
             f"`{text}`",
             f"`{transcribed[:40]}`",
             f"{acc*100:.0f}%",
             f"{total_latency:.1f}s",
             f"{inference_time:.2f}s"
         ])
+    
+    # (text, speech_start, future) per phrase, oldest first
+    in_flight = deque()
+    
+    # One worker: MLX inference calls shouldn't overlap each other,
+    # only with capture on the main thread
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        for text, rate in test_phrases:
+            log(f"  Chunked: '{text}' ({chunk_duration}s)")
+            
+            total_record_time = chunk_duration + 2.0
+            speech_start = time.time()
+            
+            say_proc = say_async(text, rate=rate)
+            
+            try:
+                audio = record_audio_chunk(total_record_time, SAMPLE_RATE_WHISPER)
+                say_proc.wait(timeout=30)
+                future = pool.submit(timed_transcribe, audio)
+            except Exception as e:
+                log_fail(f"Capture error: {e}")
+                future = None
+                say_proc.wait(timeout=10)
+            
+            in_flight.append((text, speech_start, future))
+            # Record rows for chunks already transcribed, then block
+            # only if too many are still pending
+            while in_flight and (in_flight[0][2] is None or in_flight[0][2].done()):
+                finish(*in_flight.popleft())
+            while len(in_flight) > max_pending:
+                finish(*in_flight.popleft())
+            
+            time.sleep(1.0)
         
-        time.sleep(1.0)
+        while in_flight:
+            finish(*in_flight.popleft())
     
+    md.add_table_rows(rows)
     md.add_newline()
 
 
@@ -346,16 +535,59 @@ def run_chunked_realtime(engine, md, chunk_duration=3.0):
 # MAIN
 # ============================================================
 
+def _get_or_load(engines, model_name, batch_size, quant):
+    """
+    Return a warmed LightningWhisperEngine for this config, loading
+    it only the first time it's asked for.
+    
+    WHY: main() needs the realtime configs in two phases (load
+    timing + file benchmark, then chunked realtime). Each
+    LightningWhisperMLX instance owns its weights, so rebuilding one
+    re-read hundreds of MB from disk and recompiled the MLX graph
+    every phase. The first
+    call's cold start lands in engine.load_time; later calls cost
+    nothing. A config that failed to load is cached as None so we
+    don't retry it in every phase.
+    """
+    key = (model_name, batch_size, quant)
+    if key not in engines:
+        engine = LightningWhisperEngine(model_name, batch_size, quant)
+        engines[key] = engine if engine.warmup() else None
+    return engines[key]
+
+
+def _release(engines, model_name, batch_size, quant):
+    """
+    Drop a config's engine once no later phase needs it and free
+    its MLX memory, so the next (possibly large) model doesn't load
+    on top of it.
+    """
+    engines.pop((model_name, batch_size, quant), None)
+    release_mlx_memory()
+
+
 def main():
+    parser = argparse.ArgumentParser(description="LightningWhisperMLX benchmark")
+    parser.add_argument(
+        "--force", action="store_true",
+        help="Re-run every scenario instead of reusing results from bench_cache.json"
+    )
+    parser.add_argument(
+        "--incremental", action="store_true",
+        help="Write the results markdown as the run goes instead of once at the end"
+    )
+    args = parser.parse_args()
+    
     log_section("LIGHTNING-WHISPER-MLX (vayu-whisper) BENCHMARK")
     
     ensure_directories()
+    prewarm_say()
+    cache = BenchmarkResultCache(CACHE_FILE, enabled=not args.force)
     
     # Check installation
-    try:
-        from whisper_mlx import LightningWhisperMLX
+    if LightningWhisperMLX is not None:
         log_pass("vayu-whisper (whisper_mlx) found")
-    except ImportError:
+    else:
         log_fail("vayu-whisper NOT installed.")
         print(f"\n{C.YELLOW}To install:{C.NC}")
         print("  pip install vayu-whisper")
@@ -371,7 +603,8 @@ def main():
     md = MarkdownResultWriter(
         RESULTS_FILE,
         "Lightning-Whisper-MLX Benchmark Results",
-        "LightningWhisperMLX (vayu-whisper)"
+        "LightningWhisperMLX (vayu-whisper)",
+        incremental=args.incremental
     )
     
     md.add_text(
@@ -385,53 +618,71 @@ def main():
     )
     
     # ========================================================
-    # Model Loading Benchmark
+    # Model Loading + File-Based Benchmark, one config at a time
     # ========================================================
-    log_section("MODEL LOADING TIME")
-    md.add_section("Model Loading Time")
-    md.add_table_header(["Config", "Load Time", "Description"])
+    # Each config is loaded, timed, benchmarked and (unless the
+    # chunked realtime phase needs it) released before the next one
+    # loads, so at most one large model is resident at a time. The
+    # load times are collected and written as one table afterwards.
     
-    for model_name, batch_size, quant, display_name, description in LIGHTNING_CONFIGS:
-        log(f"\n  Loading: {display_name}")
-        engine = LightningWhisperEngine(model_name, batch_size, quant)
-        start = time.time()
-        success = engine.warmup()
-        load_time = time.time() - start
-        
-        if success:
-            md.add_table_row([display_name, f"{load_time:.1f}s", description[:60]])
-        else:
-            md.add_table_row([display_name, "FAILED", description[:60]])
+    # Render the scenario audio while the first model loads; `say`
+    # and model loading don't compete for the same resources
+    prerender_pool = ThreadPoolExecutor(max_workers=1)
+    scenario_wavs_future = prerender_pool.submit(prerender_scenario_wavs, STANDARD_SCENARIOS)
+    prerender_pool.shutdown(wait=False)
     
-    md.add_newline()
+    # (model, batch_size, quant) -> warmed engine, or None if it failed
+    engines = {}
+    load_rows = []
     
-    # ========================================================
-    # File-Based Benchmark for each config
-    # ========================================================
-    for model_name, batch_size, quant, display_name, description in LIGHTNING_CONFIGS:
-        log_section(f"FILE BENCHMARK: {display_name}")
+    # Configs the chunked realtime phase will still need
+    has_pyaudio = check_pyaudio_available()
+    realtime_cfgs = [cfg for cfg in LIGHTNING_CONFIGS
+                     if cfg.model in REALTIME_MODELS and cfg.quant == REALTIME_QUANT]
+    if not has_pyaudio:
+        realtime_cfgs = []
+    
+    for cfg in LIGHTNING_CONFIGS:
+        log_section(f"LOAD + FILE BENCHMARK: {cfg.display_name}")
+        engine = _get_or_load(engines, cfg.model, cfg.batch_size, cfg.quant)
         
-        engine = LightningWhisperEngine(model_name, batch_size, quant)
-        if not engine.warmup():
-            log_warn(f"Skipping {display_name}")
+        if not engine:
+            load_rows.append([cfg.display_name, "FAILED", cfg.description[:60]])
+            log_warn(f"Skipping {cfg.display_name}")
             continue
+        load_rows.append([cfg.display_name, f"{engine.load_time:.1f}s", cfg.description[:60]])
         
-        md.add_section(f"File Benchmark: {display_name}")
-        md.add_text(f"Model: `{model_name}`, batch_size={batch_size}, quant={quant or 'none'}")
-        md.add_text(description)
+        md.add_section(f"File Benchmark: {cfg.display_name}")
+        md.add_text(f"Model: `{cfg.model}`, batch_size={cfg.batch_size}, quant={cfg.quant or 'none'}")
+        md.add_text(cfg.description)
         
-        run_file_benchmark(engine, md, display_name, STANDARD_SCENARIOS)
+        run_file_benchmark(engine, md, cfg.display_name, STANDARD_SCENARIOS, cache,
+                           precomputed_wavs=scenario_wavs_future.result())
+        
+        if cfg not in realtime_cfgs:
+            engine = None
+            _release(engines, cfg.model, cfg.batch_size, cfg.quant)
+    
+    md.add_section("Model Loading Time")
+    md.add_table_header(["Config", "Load Time", "Description"])
+    md.add_table_rows(load_rows)
+    md.add_newline()
     
     # ========================================================
-    # Chunked Realtime (tiny and base only)
+    # Chunked Realtime (tiny and base only, 4-bit)
     # ========================================================
-    if check_pyaudio_available():
-        for model_name, batch_size, quant, display_name, _ in LIGHTNING_CONFIGS[:2]:
+    if has_pyaudio:
+        for cfg in realtime_cfgs:
+            log_info(f"Chunked realtime uses {REALTIME_QUANT} weights: {cfg.display_name}")
+            engine = _get_or_load(engines, cfg.model, cfg.batch_size, cfg.quant)
+            if not engine:
+                log_warn(f"Skipping {cfg.display_name}")
+                continue
             for chunk_dur in [2.0, 3.0, 5.0]:
-                log_section(f"CHUNKED REALTIME: {display_name} ({chunk_dur}s)")
-                engine = LightningWhisperEngine(model_name, batch_size, quant)
-                engine.warmup()
+                log_section(f"CHUNKED REALTIME: {cfg.display_name} ({chunk_dur}s)")
                 run_chunked_realtime(engine, md, chunk_duration=chunk_dur)
+            engine = None
+            _release(engines, cfg.model, cfg.batch_size, cfg.quant)
     else:
         md.add_section("Chunked Realtime (SKIPPED — no PyAudio)")
     
@@ -447,6 +698,8 @@ def main():
         "4. What's the optimal batch_size for each model on this hardware?"
     )
     
+    md.close()
+    
     log_section("BENCHMARK COMPLETE")
     log(f"Results saved to: {RESULTS_FILE}")
     
@@ -43,6 +43,7 @@ MODELS (downloaded automatically from HuggingFace):
 
 RUN:
   python3 tests/neural-engine-stt-benchmarks/test-mlx-whisper-realtime.py
+  python3 tests/neural-engine-stt-benchmarks/test-mlx-whisper-realtime.py --parallel-models
 
 CREATED: 2026-02-07 from research on Neural Engine STT alternatives.
 The user wanted to test models beyond Apple SpeechAnalyzer and
@@ -50,12 +51,14 @@ raw whisper.cpp for real-time transcription on Mac.
 ============================================================
 """
 
+import argparse
 import os
 import sys
 import time
 import tempfile
 import threading
 import subprocess
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
 # Add parent path so we can import shared utils
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -64,14 +67,37 @@ sys.path.insert(0, SCRIPT_DIR)
 from shared_test_utils import (
     C, log, log_section, log_pass, log_fail, log_warn, log_info,
     say_and_wait, say_to_wav_file, say_async, say_to_aiff_and_play,
-    word_accuracy, word_error_rate,
-    record_audio_chunk, save_audio_to_wav,
+    iter_scenario_wavs, prerender_scenario_wavs,
+    word_accuracy, word_accuracy_and_wer,
+    record_audio_chunk, wav_duration, read_wav_float32,
     MarkdownResultWriter, BenchmarkScenario, STANDARD_SCENARIOS,
     RESULTS_DIR, MODELS_DIR, TMP_DIR, SAMPLE_RATE_WHISPER,
-    ensure_directories, check_pyaudio_available, check_numpy_available,
-    announce_completion, POST_SPEECH_WAIT
+    ensure_directories, prewarm_say, check_pyaudio_available, check_numpy_available,
+    announce_completion, release_mlx_memory, POST_SPEECH_WAIT
 )
 
+# mlx-whisper and numpy are imported once here instead of inside
+# every transcribe call. They stay optional at import time so main()
+# can print install instructions rather than a traceback.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from mlx_whisper import transcribe as _mlx_transcribe
+except ImportError:
+    _mlx_transcribe = None
+
+# mlx_whisper's in-process model cache (one model at a time).
+# Internal, so older/newer releases may not have it.
+try:
+    import mlx.core as mx
+    from mlx_whisper.transcribe import ModelHolder as _ModelHolder
+except ImportError:
+    mx = None
+    _ModelHolder = None
+
 
 # ============================================================
 # MLX-WHISPER SPECIFIC CONFIGURATION
@@ -116,9 +142,26 @@ MLX_MODELS = [
 # but potentially worse accuracy (less context).
 CHUNK_DURATIONS = [2.0, 3.0, 5.0]
 
+# Scenario B records chunk_duration + 2s per phrase. Recording the
+# longest of those once lets a model's later chunk durations reuse
+# a prefix of the same capture (see run_chunked_realtime_simulation).
+CHUNK_RECORD_SECONDS = max(CHUNK_DURATIONS) + 2.0
+
+# (model_repo, phrase, rate) -> float32 mic capture of
+# CHUNK_RECORD_SECONDS. Keyed per model so each model's first
+# chunk duration still measures real end-to-end latency.
+_audio_cache = {}
+
 # Results file path
 RESULTS_FILE = os.path.join(RESULTS_DIR, "mlx-whisper-benchmark-results.md")
 
+# --parallel-models: Scenario A worker processes, and the guards
+# that keep them from thrashing unified memory. Large models
+# (distil-large-v3 and up) always run in the main process.
+PARALLEL_WORKERS = 2
+PARALLEL_MIN_RAM_GB = 16
+PARALLEL_SKIP_MARKERS = ("large",)
+
 
 # ============================================================
 # MLX-WHISPER ENGINE WRAPPER
@@ -151,6 +194,8 @@ class MlxWhisperEngine:
         self.model_repo = model_repo
         self.model_loaded = False
         self.load_time = None
+        # Set once a real utterance has been decoded (warm_decoder)
+        self.decoder_warmed = False
     
     def warmup(self):
         """
@@ -165,40 +210,80 @@ class MlxWhisperEngine:
         We still measure and report the load time because it's
         important for app startup UX.
         """
-        try:
-            from mlx_whisper import transcribe
-        except ImportError:
+        if _mlx_transcribe is None:
             log_fail("mlx-whisper not installed. Run: pip install mlx-whisper")
             return False
         
         log(f"  Warming up model: {self.model_repo}")
         log(f"  (First run downloads the model — this may take a while)")
         
-        # Create a tiny silent WAV file for the warmup transcription
-        warmup_path = os.path.join(TMP_DIR, "mlx_warmup.wav")
-        import numpy as np
-        # 1 second of silence at 16kHz
+        # 1 second of silence at 16kHz, passed as an array: there's
+        # nothing for ffmpeg to decode, so warmup is just the model.
+        # (transcribe() has no entry point for a precomputed mel.)
         silence = np.zeros(SAMPLE_RATE_WHISPER, dtype=np.float32)
-        save_audio_to_wav(silence, warmup_path)
         
         start = time.time()
         try:
-            result = transcribe(
-                warmup_path,
+            # Load the weights into mlx_whisper's model cache up
+            # front (same key transcribe() uses: repo + fp16), so
+            # they're resident before the first real inference.
+            if _ModelHolder is not None:
+                # mlx_whisper holds one model at a time. Evict the
+                # previous one and free its buffers BEFORE loading
+                # ours, instead of having both resident mid-swap.
+                if _ModelHolder.model_path not in (None, self.model_repo):
+                    _ModelHolder.model = None
+                    _ModelHolder.model_path = None
+                    release_mlx_memory()
+                _ModelHolder.get_model(self.model_repo, mx.float16)
+            
+            result = _mlx_transcribe(
+                silence,
                 path_or_hf_repo=self.model_repo,
                 language="en",
                 verbose=False
             )
             self.load_time = time.time() - start
             self.model_loaded = True
+            self.decoder_warmed = False
             log(f"  Model loaded in {self.load_time:.1f}s")
             return True
         except Exception as e:
             log_fail(f"Model warmup failed: {e}")
             return False
-        finally:
-            if os.path.exists(warmup_path):
-                os.unlink(warmup_path)
+    
+    def warm_decoder(self, audio_float32):
+        """
+        Run one untimed transcription of real speech, once per load.
+        
+        WHY: the silence warmup loads the weights and builds the
+        encoder kernels, but the decoder stops after a token or two.
+        MLX builds kernels lazily per shape, so the first utterance
+        that decodes a full sentence still pays for the longer
+        token loop, and Scenario A's first row reported an inflated
+        time (and RTF). Decoding one real clip here is the JIT barrier,
+        so every timed row is steady-state. (mlx_whisper runs its own
+        decode loop, so there's no step function to mx.compile.)
+        """
+        if self.decoder_warmed:
+            return
+        self.transcribe_audio_array(audio_float32)
+        self.decoder_warmed = True
+    
+    def is_resident(self):
+        """
+        True if mlx_whisper's in-process model cache currently holds
+        this engine's model.
+        
+        WHY: mlx_whisper keeps only ONE model loaded (ModelHolder,
+        keyed by repo). Once another engine transcribes, our weights
+        are gone and the next call silently reloads them inside a
+        timed inference. Callers use this to decide whether a cached
+        engine needs warming again before it's benchmarked.
+        """
+        if _ModelHolder is None:
+            return False
+        return self.model_loaded and _ModelHolder.model_path == self.model_repo
     
     def transcribe_file(self, wav_path):
         """
@@ -213,27 +298,18 @@ class MlxWhisperEngine:
         Returns:
             tuple: (transcribed_text, inference_time_seconds)
         """
-        from mlx_whisper import transcribe
-        
-        start = time.time()
-        result = transcribe(
-            wav_path,
-            path_or_hf_repo=self.model_repo,
-            language="en",
-            verbose=False
-        )
-        inference_time = time.time() - start
-        
-        text = result.get("text", "").strip()
-        return text, inference_time
+        return self._transcribe(wav_path)
     
     def transcribe_audio_array(self, audio_float32):
         """
         Transcribe a numpy float32 audio array.
         
-        WHY: This is a convenience method that handles the
-        file-based workflow internally. It saves the array
-        to a temp WAV, transcribes, then cleans up.
+        WHY NO TEMP FILE: mlx_whisper.transcribe() accepts an
+        ndarray as well as a path. Going through a WAV meant a disk
+        write plus an ffmpeg spawn to decode it back on every chunk,
+        which on tiny/base models cost more than the inference
+        itself. The array is already 16kHz float32 mono (that's what
+        record_audio_chunk returns), so it goes straight in.
         
         Args:
             audio_float32: numpy array of float32 samples at 16kHz
@@ -241,22 +317,32 @@ class MlxWhisperEngine:
         Returns:
             tuple: (transcribed_text, inference_time_seconds)
         """
-        tmp_path = os.path.join(TMP_DIR, f"mlx_chunk_{os.getpid()}.wav")
-        save_audio_to_wav(audio_float32, tmp_path)
+        audio = np.ascontiguousarray(audio_float32, dtype=np.float32).ravel()
+        return self._transcribe(audio)
+    
+    def _transcribe(self, audio):
+        """
+        Run mlx_whisper.transcribe on a path or ndarray and time it.
+        Returns (text, inference_time).
+        """
+        start = time.time()
+        result = _mlx_transcribe(
+            audio,
+            path_or_hf_repo=self.model_repo,
+            language="en",
+            verbose=False
+        )
+        inference_time = time.time() - start
         
-        try:
-            text, inference_time = self.transcribe_file(tmp_path)
-            return text, inference_time
-        finally:
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+        text = result.get("text", "").strip()
+        return text, inference_time
 
 
 # ============================================================
 # TEST SCENARIOS
 # ============================================================
 
-def run_file_transcription_benchmark(engine, md, scenarios):
+def run_file_transcription_benchmark(engine, md, scenarios, precomputed_wavs=None):
     """
     SCENARIO A: File-Based Transcription Benchmark
     
@@ -268,6 +354,13 @@ def run_file_transcription_benchmark(engine, md, scenarios):
     understand where the bottleneck is. If inference alone
     is too slow for realtime, there's no point optimizing
     the audio capture pipeline.
+    
+    WHY decode here instead of transcribe_file(): given a path,
+    mlx_whisper spawns ffmpeg to decode it on every call. The
+    cached renders are already 16kHz mono PCM, so we read them
+    in-process (outside the timed call) and pass the array, the
+    same way Scenario B passes mic audio. Inference time is now
+    model time only, without the ffmpeg spawn.
     """
     md.add_section("Scenario A: File-Based Transcription (Pure Inference)")
     md.add_text(
@@ -281,29 +374,35 @@ def run_file_transcription_benchmark(engine, md, scenarios):
         "WER", "Inference Time", "Audio Duration", "RTF"
     ])
     
-    for scenario in scenarios:
+    # Pre-rendered audio (cached across models and runs). main()
+    # renders it once up front; otherwise render ahead in the
+    # background while we transcribe.
+    if precomputed_wavs is not None:
+        scenario_wavs = ((s, precomputed_wavs[s.name]) for s in scenarios)
+    else:
+        scenario_wavs = iter_scenario_wavs(scenarios)
+    
+    rows = []
+    for scenario, wav_path in scenario_wavs:
         log(f"\n  Testing: {scenario.name}")
         
-        # Pre-render the audio to a WAV file
-        wav_path = os.path.join(TMP_DIR, f"mlx_bench_{scenario.name.replace(' ', '_')}.wav")
-        say_to_wav_file(scenario.text, wav_path, rate=scenario.rate)
-        
-        # Measure the audio duration from the WAV file
-        import wave
-        with wave.open(wav_path, 'r') as wf:
-            audio_duration = wf.getnframes() / wf.getframerate()
-        
-        # Transcribe
+        # Transcribe (decode untimed; see docstring)
         try:
-            text, inference_time = engine.transcribe_file(wav_path)
+            audio, sample_rate = read_wav_float32(wav_path)
+            audio_duration = len(audio) / sample_rate
+            if sample_rate == SAMPLE_RATE_WHISPER and audio.ndim == 1:
+                engine.warm_decoder(audio)
+                text, inference_time = engine.transcribe_audio_array(audio)
+            else:
+                text, inference_time = engine.transcribe_file(wav_path)
         except Exception as e:
             log_fail(f"Transcription error: {e}")
             text = f"ERROR: {e}"
             inference_time = 0
+            audio_duration = wav_duration(wav_path)
         
         # Calculate metrics
-        acc = word_accuracy(scenario.text, text)
-        wer = word_error_rate(scenario.text, text)
+        acc, wer = word_accuracy_and_wer(scenario.ref_tokens(), text)
         # RTF = Real-Time Factor = inference_time / audio_duration
         # RTF < 1.0 means faster than real-time
         rtf = inference_time / audio_duration if audio_duration > 0 else 999
@@ -316,7 +415,7 @@ def run_file_transcription_benchmark(engine, md, scenarios):
             f"Got: '{text[:60]}...' " if len(text) > 60 else f"    Accuracy: {acc_color}{acc*100:.0f}%{C.NC} | RTF: {rtf_color}{rtf:.2f}{C.NC} | Got: '{text}'")
         
         # Log to markdown
-        md.add_table_row([
+        rows.append([
             scenario.name,
             f"`{scenario.text[:50]}{'...' if len(scenario.text) > 50 else ''}`",
             f"`{text[:50]}{'...' if len(text) > 50 else ''}`",
@@ -326,11 +425,8 @@ def run_file_transcription_benchmark(engine, md, scenarios):
             f"{audio_duration:.1f}s",
             f"{rtf:.2f}"
         ])
-        
-        # Clean up WAV file
-        if os.path.exists(wav_path):
-            os.unlink(wav_path)
     
+    md.add_table_rows(rows)
     md.add_newline()
     md.add_text(
         "**RTF (Real-Time Factor)**: Inference time / audio duration. "
@@ -360,12 +456,23 @@ def run_chunked_realtime_simulation(engine, md, chunk_duration=3.0):
       for the model, potentially worse accuracy
     - Longer chunks (5s) = better accuracy but higher latency
     - We test multiple chunk durations to find the sweet spot
+    
+    WHY the audio cache: the say → speaker → mic round trip is the
+    slow part, and it captured the same phrase once per model and
+    chunk duration. Each model now records each phrase once, on its
+    first chunk duration, at the longest length any chunk duration
+    needs; its later runs transcribe the first chunk_duration + 2s
+    of that capture. Those cached runs have no speech to wait for,
+    so their latency is inference-only. The cache is per model, so
+    every model gets one real end-to-end row per phrase.
     """
     md.add_section(f"Scenario B: Chunked Real-Time Simulation ({chunk_duration}s chunks)")
     md.add_text(
         f"Records {chunk_duration}s audio chunks from mic, transcribes each. "
         f"Measures end-to-end latency from speech start to transcription result. "
-        f"Uses macOS `say` command to generate test audio through speakers."
+        f"Uses macOS `say` command to generate test audio through speakers. "
+        f"Each phrase is captured once per model; rows marked *(cached audio)* "
+        f"reuse that capture and report inference-only latency."
     )
     md.add_newline()
     md.add_table_header([
@@ -387,40 +494,71 @@ def run_chunked_realtime_simulation(engine, md, chunk_duration=3.0):
         # than the say duration to ensure we get all the audio.
         # We run say in background and record simultaneously.
         total_record_time = chunk_duration + 2.0  # Extra buffer
-        
-        # Start recording in background
-        import numpy as np
+        num_samples = int(total_record_time * SAMPLE_RATE_WHISPER)
         
         collected_text = ""
         total_inference = 0.0
-        speech_start = time.time()
-        
-        # Play the test phrase
-        say_proc = say_async(text, rate=rate)
+        cache_key = (engine.model_repo, text, rate)
+        cached_audio = _audio_cache.get(cache_key)
         
-        # Record a chunk
-        try:
-            audio = record_audio_chunk(total_record_time, SAMPLE_RATE_WHISPER)
+        if cached_audio is not None:
+            try:
+                collected_text, total_inference = engine.transcribe_audio_array(
+                    cached_audio[:num_samples]
+                )
+            except Exception as e:
+                log_fail(f"Error: {e}")
+                collected_text = f"ERROR: {e}"
+            total_latency = total_inference
+        else:
+            speech_start = time.time()
             
-            # Wait for say to finish
-            say_proc.wait(timeout=30)
+            # Play the test phrase
+            say_proc = say_async(text, rate=rate)
             
-            # Transcribe the chunk
-            transcribed, inference_time = engine.transcribe_audio_array(audio)
-            collected_text = transcribed
-            total_inference = inference_time
-        except Exception as e:
-            log_fail(f"Error: {e}")
-            collected_text = f"ERROR: {e}"
-            say_proc.wait(timeout=10)
+            # Transcribe this chunk as soon as it's captured, while
+            # the rest of the (cache-length) recording continues
+            prefix_result = {}
+            def transcribe_prefix(prefix):
+                prefix_result["text"], prefix_result["inference"] = (
+                    engine.transcribe_audio_array(prefix)
+                )
+                prefix_result["latency"] = time.time() - speech_start
+            
+            try:
+                audio = record_audio_chunk(
+                    CHUNK_RECORD_SECONDS, SAMPLE_RATE_WHISPER,
+                    prefix_seconds=total_record_time, on_prefix=transcribe_prefix
+                )
+                _audio_cache[cache_key] = audio
+                
+                # Wait for say to finish (normally already done)
+                say_proc.wait(timeout=30)
+                
+                if not prefix_result:
+                    # Capture stalled before the prefix; use what we got
+                    prefix_result["text"], prefix_result["inference"] = (
+                        engine.transcribe_audio_array(audio[:num_samples])
+                    )
+                    prefix_result["latency"] = time.time() - speech_start
+                collected_text = prefix_result["text"]
+                total_inference = prefix_result["inference"]
+                total_latency = prefix_result["latency"]
+            except Exception as e:
+                log_fail(f"Error: {e}")
+                collected_text = f"ERROR: {e}"
+                say_proc.wait(timeout=10)
+                total_latency = time.time() - speech_start
         
-        total_latency = time.time() - speech_start
         acc = word_accuracy(text, collected_text)
+        latency_str = f"{total_latency:.1f}s"
+        if cached_audio is not None:
+            latency_str += " (cached audio)"
         
         # Log
         acc_color = C.GREEN if acc >= 0.8 else C.YELLOW if acc >= 0.5 else C.RED
         log(f"    {acc_color}{acc*100:.0f}% accuracy{C.NC} | "
-            f"Latency: {total_latency:.1f}s | "
+            f"Latency: {latency_str} | "
             f"Inference: {total_inference:.2f}s | "
             f"Got: '{collected_text[:60]}'")
         
@@ -429,16 +567,66 @@ def run_chunked_realtime_simulation(engine, md, chunk_duration=3.0):
             f"`{text}`",
             f"`{collected_text[:50]}`",
             f"{acc*100:.0f}%",
-            f"{total_latency:.1f}s",
+            latency_str,
             f"{total_inference:.2f}s"
         ])
         
-        time.sleep(1.0)  # Gap between tests
+        if cached_audio is None:
+            time.sleep(1.0)  # Gap between tests (lets the room go quiet)
     
     md.add_newline()
 
 
-def run_model_loading_benchmark(md):
+def _get_or_load(engines, model_repo):
+    """
+    Return a warmed MlxWhisperEngine for model_repo, reusing the
+    one from an earlier phase when its model is still resident.
+    
+    WHY: main() used to build and warm a fresh engine for every
+    phase and every chunk duration. Warmup only has to happen again
+    when mlx_whisper has swapped another model in since (see
+    MlxWhisperEngine.is_resident) — re-warming then keeps the reload
+    out of the first timed transcription. load_time keeps the
+    cold-start number from the first load. A repo that failed is
+    cached as None so later phases skip it.
+    """
+    engine = engines.get(model_repo)
+    if model_repo not in engines:
+        engine = MlxWhisperEngine(model_repo)
+        engines[model_repo] = engine if engine.warmup() else None
+        return engines[model_repo]
+    
+    if engine and not engine.is_resident():
+        cold_load_time = engine.load_time
+        if not engine.warmup():
+            engines[model_repo] = None
+            return None
+        engine.load_time = cold_load_time
+    return engine
+
+
+def _download_model(model_repo):
+    """
+    Fetch a model's files into the HuggingFace cache without
+    loading it. Returns True if the files are now local.
+    
+    mlx_whisper's load_model() calls snapshot_download() for any
+    repo that isn't a local path, so after this the timed warmup
+    finds everything in the cache.
+    """
+    try:
+        from huggingface_hub import snapshot_download
+    except ImportError:
+        return False
+    try:
+        snapshot_download(repo_id=model_repo)
+        return True
+    except Exception as e:
+        log_warn(f"  Download failed for {model_repo}: {e}")
+        return False
+
+
+def run_model_loading_benchmark(md, engines):
     """
     SCENARIO C: Model Loading Time
     
@@ -460,19 +648,26 @@ def run_model_loading_benchmark(md):
     md.add_newline()
     md.add_table_header(["Model", "Load + First Inference", "Model Description"])
     
+    # Downloads are network-bound, so on a first run fetch every
+    # model in parallel. Loading and the first inference stay
+    # serial below so the timings aren't competing for the GPU.
+    log("  Fetching models (parallel download, cached after first run)")
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        downloads = {pool.submit(_download_model, repo): repo for repo, _, _ in MLX_MODELS}
+        for future in as_completed(downloads):
+            if future.result():
+                log(f"    Ready: {downloads[future]}")
+    
     for model_repo, display_name, description in MLX_MODELS:
         log(f"\n  Loading: {display_name} ({model_repo})")
         
-        engine = MlxWhisperEngine(model_repo)
-        start = time.time()
-        success = engine.warmup()
-        load_time = time.time() - start
+        engine = _get_or_load(engines, model_repo)
         
-        if success:
-            log(f"    Loaded in {load_time:.1f}s")
+        if engine:
+            log(f"    Loaded in {engine.load_time:.1f}s")
             md.add_table_row([
                 display_name,
-                f"{load_time:.1f}s",
+                f"{engine.load_time:.1f}s",
                 description[:80]
             ])
         else:
@@ -486,6 +681,47 @@ def run_model_loading_benchmark(md):
     md.add_newline()
 
 
+def _parallel_models_allowed():
+    """
+    True if this machine has the RAM for --parallel-models.
+    
+    WHY a total-RAM gate: each worker process loads its own copy
+    of a model next to the main process's resident one. On a
+    small unified-memory Mac that swaps, and the swapping shows
+    up in the very inference times Scenario A reports.
+    """
+    try:
+        ram_bytes = os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+    except (ValueError, OSError, AttributeError):
+        log_warn("Can't read physical RAM — running Scenario A serially")
+        return False
+    if ram_bytes < PARALLEL_MIN_RAM_GB * 1024 ** 3:
+        log_warn(f"{ram_bytes / 1024 ** 3:.0f}GB RAM < {PARALLEL_MIN_RAM_GB}GB "
+                 f"— running Scenario A serially")
+        return False
+    return True
+
+
+def _scenario_a_worker(model_repo, scenario_wavs):
+    """
+    Run Scenario A for one model in a worker process
+    (--parallel-models) and return its markdown fragment, or
+    None if the model failed to load.
+    
+    WHY a process, not a thread: mlx_whisper keeps one model
+    resident per process (ModelHolder), so two models can only
+    be warm at once in separate processes. One model's warmup
+    then overlaps another's transcriptions.
+    """
+    engine = MlxWhisperEngine(model_repo)
+    if not engine.warmup():
+        return None
+    md = MarkdownResultWriter.fragment()
+    run_file_transcription_benchmark(engine, md, STANDARD_SCENARIOS,
+                                     precomputed_wavs=scenario_wavs)
+    return md.getvalue()
+
+
 # ============================================================
 # MAIN TEST RUNNER
 # ============================================================
@@ -498,10 +734,20 @@ def main():
     results to a markdown file. Does NOT run if mlx-whisper
     is not installed — prints installation instructions instead.
     """
+    parser = argparse.ArgumentParser(description="mlx-whisper benchmark")
+    parser.add_argument(
+        "--parallel-models", action="store_true",
+        help=f"Run Scenario A for small models in {PARALLEL_WORKERS} worker processes. "
+             "Faster, but concurrent models share the GPU, so inference times "
+             "are not comparable with a serial run."
+    )
+    args = parser.parse_args()
+    
     log_section("MLX-WHISPER REAL-TIME TRANSCRIPTION BENCHMARK")
     
     # Pre-flight checks
     ensure_directories()
+    prewarm_say()
     
     # Check if mlx-whisper is installed
     try:
@@ -540,23 +786,64 @@ def main():
     # SCENARIO C: Model Loading (run first because it warms up models)
     # ========================================================
     log_section("SCENARIO C: Model Loading Time")
-    run_model_loading_benchmark(md)
+    # Render the scenario audio while the models load; `say`
+    # and model loading don't compete for the same resources
+    prerender_pool = ThreadPoolExecutor(max_workers=1)
+    scenario_wavs_future = prerender_pool.submit(prerender_scenario_wavs, STANDARD_SCENARIOS)
+    prerender_pool.shutdown(wait=False)
+    
+    # model_repo -> warmed engine, or None if it failed to load
+    engines = {}
+    run_model_loading_benchmark(md, engines)
+    scenario_wavs = scenario_wavs_future.result()
     
     # ========================================================
     # SCENARIO A: File-Based Benchmark (for each model)
     # ========================================================
+    # With --parallel-models, small models that loaded in Scenario C
+    # run in worker processes; their fragments are merged in model
+    # order below. Large models still run here, after the workers.
+    parallel = {}
+    if args.parallel_models and _parallel_models_allowed():
+        pool = ProcessPoolExecutor(max_workers=PARALLEL_WORKERS)
+        parallel = {
+            repo: pool.submit(_scenario_a_worker, repo, scenario_wavs)
+            for repo, _, _ in MLX_MODELS
+            if engines.get(repo) and not any(m in repo for m in PARALLEL_SKIP_MARKERS)
+        }
+        pool.shutdown(wait=False)
+        md.add_text(
+            f"*Scenario A ran with --parallel-models ({PARALLEL_WORKERS} workers): "
+            "times for the smaller models include GPU contention between them.*"
+        )
+    
     for model_repo, display_name, description in MLX_MODELS:
         log_section(f"SCENARIO A: File-Based Benchmark — {display_name}")
         
-        engine = MlxWhisperEngine(model_repo)
-        if not engine.warmup():
+        if model_repo in parallel:
+            try:
+                fragment = parallel[model_repo].result()
+            except Exception as e:
+                log_warn(f"Worker failed for {display_name} ({e}) — running in-process")
+            else:
+                if fragment is None:
+                    log_warn(f"Skipping {display_name} — failed to load")
+                    continue
+                md.add_section(f"Model: {display_name}", level=2)
+                md.add_text(f"**Repo**: `{model_repo}`\n\n**Description**: {description}")
+                md.append(fragment)
+                continue
+        
+        engine = _get_or_load(engines, model_repo)
+        if not engine:
             log_warn(f"Skipping {display_name} — failed to load")
             continue
         
         md.add_section(f"Model: {display_name}", level=2)
         md.add_text(f"**Repo**: `{model_repo}`\n\n**Description**: {description}")
         
-        run_file_transcription_benchmark(engine, md, STANDARD_SCENARIOS)
+        run_file_transcription_benchmark(engine, md, STANDARD_SCENARIOS,
+                                         precomputed_wavs=scenario_wavs)
     
     # ========================================================
     # SCENARIO B: Chunked Real-Time Simulation (best model only)
@@ -569,8 +856,10 @@ def main():
                 log_section(
                     f"SCENARIO B: Chunked Realtime — {display_name} ({chunk_dur}s)"
                 )
-                engine = MlxWhisperEngine(model_repo)
-                engine.warmup()
+                engine = _get_or_load(engines, model_repo)
+                if not engine:
+                    log_warn(f"Skipping {display_name} — failed to load")
+                    break
                 run_chunked_realtime_simulation(engine, md, chunk_duration=chunk_dur)
     else:
         md.add_section("Scenario B: Chunked Real-Time (SKIPPED)")
@@ -588,6 +877,8 @@ def main():
         "4. How does latency compare to Apple SpeechAnalyzer (~1-3s first result)?"
     )
     
+    md.close()
+    
     log_section("BENCHMARK COMPLETE")
     log(f"Results saved to: {RESULTS_FILE}")
     
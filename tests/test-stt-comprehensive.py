@@ -15,34 +15,77 @@ RUN: python3 tests/test-stt-comprehensive.py
 ============================================================
 """
 
+import bisect
+import functools
+import hashlib
+import io
 import subprocess
 import json
 import time
 import sys
 import os
 import threading
-import queue
 import re
+import selectors
 from datetime import datetime
 
+# orjson parses (and encodes) the helper's JSON lines several times
+# faster than the stdlib; optional, with json as the fallback.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_DIR = os.path.dirname(SCRIPT_DIR)
 HELPER_BIN = os.path.join(PROJECT_DIR, "swift-helper", "BubbleVoiceSpeech", ".build", "debug", "BubbleVoiceSpeech")
 RESULTS_MD = os.path.join(PROJECT_DIR, "docs", "STT-Comprehensive-Test-Results.md")
 
+
+@functools.lru_cache(maxsize=128)
+def _encode_command(cmd_type):
+    """Encoded line for a data-less command; start/stop/reset repeat constantly."""
+    return (json.dumps({"type": cmd_type}) + "\n").encode('utf-8')
+
+
 # ============================================================
 # HELPER PROCESS CLASS (same as test-stt-direct.py)
 # ============================================================
 
+class LazyEntry(dict):
+    """A stdout entry whose 'parsed' JSON is decoded on first access."""
+    __slots__ = ()
+    
+    def __missing__(self, key):
+        if key != 'parsed':
+            raise KeyError(key)
+        try:
+            parsed = _json_loads(self['raw'])
+        except ValueError:
+            parsed = None
+        self['parsed'] = parsed
+        return parsed
+
+
 class SpeechHelperProcess:
     def __init__(self, binary_path):
         self.binary_path = binary_path
         self.process = None
         self.stdout_lines = []
         self.stderr_lines = []
-        self.stdout_queue = queue.Queue()
-        self._stdout_thread = None
-        self._stderr_thread = None
+        # wait_for_message() consumes stdout_lines from _cursor on;
+        # the reader notifies _cond per line, so waiters wake on
+        # arrival instead of polling
+        self._cond = threading.Condition()
+        self._cursor = 0
+        # transcription_update entries with a parallel arrival-time
+        # list, so the get_*_since queries bisect to their start
+        # instead of scanning every line
+        self._trans_entries = []
+        self._trans_times = []
+        self._pump_thread = None
         self._running = False
         
     def start(self):
@@ -54,78 +97,142 @@ class SpeechHelperProcess:
             bufsize=0
         )
         self._running = True
-        self._stdout_thread = threading.Thread(target=self._read_stdout, daemon=True)
-        self._stderr_thread = threading.Thread(target=self._read_stderr, daemon=True)
-        self._stdout_thread.start()
-        self._stderr_thread.start()
+        self._pump_thread = threading.Thread(target=self._pump, daemon=True)
+        self._pump_thread.start()
         
-    def _read_stdout(self):
+    def _pump(self):
+        # One thread services both pipes: select, drain whatever is ready
+        # in blocks (not one readline() per message), and hand complete
+        # lines to that pipe's handler. A partial last line waits in
+        # pending until the rest arrives. 'raw' stays bytes.
+        sel = selectors.DefaultSelector()
+        handlers = {
+            self.process.stdout.fileno(): self._store_line,
+            self.process.stderr.fileno(): self._store_stderr_line,
+        }
+        pending = {}
+        for fd in handlers:
+            sel.register(fd, selectors.EVENT_READ)
+            pending[fd] = b''
         try:
-            for line in iter(self.process.stdout.readline, b''):
-                if not self._running:
-                    break
-                decoded = line.decode('utf-8').strip()
-                if decoded:
-                    entry = {'raw': decoded, 'time': time.time(), 'parsed': None}
-                    try:
-                        entry['parsed'] = json.loads(decoded)
-                    except json.JSONDecodeError:
-                        pass
-                    self.stdout_lines.append(entry)
-                    self.stdout_queue.put(entry)
+            while self._running and sel.get_map():
+                for key, _ in sel.select(timeout=0.5):
+                    fd = key.fd
+                    chunk = os.read(fd, 65536)
+                    now = time.time()
+                    if not chunk:
+                        handlers[fd](pending[fd], now)
+                        sel.unregister(fd)
+                        continue
+                    lines = (pending[fd] + chunk).split(b'\n')
+                    pending[fd] = lines.pop()
+                    for line in lines:
+                        handlers[fd](line, now)
         except Exception:
             pass
+        finally:
+            sel.close()
+    
+    def _store_line(self, line, now):
+        line = line.strip()
+        if not line:
+            return
+        # JSON is decoded lazily (LazyEntry), so updates no query looks
+        # at are never parsed; the type is peeked from the raw bytes
+        # (quotes inside JSON strings are escaped, so this can't match text)
+        entry = LazyEntry(raw=line, time=now)
+        if not line.startswith(b'{'):
+            entry['parsed'] = None
+        with self._cond:
+            self.stdout_lines.append(entry)
+            if b'"transcription_update"' in line:
+                # Entry before time: readers bound their slice by the
+                # times list, so they never see a time without its entry
+                self._trans_entries.append(entry)
+                self._trans_times.append(now)
+            self._cond.notify_all()
                 
-    def _read_stderr(self):
-        try:
-            for line in iter(self.process.stderr.readline, b''):
-                if not self._running:
-                    break
-                decoded = line.decode('utf-8').strip()
-                if decoded:
-                    self.stderr_lines.append({'text': decoded, 'time': time.time()})
-        except Exception:
-            pass
+    def _store_stderr_line(self, line, now):
+        line = line.strip()
+        if line:
+            self.stderr_lines.append({'text': line.decode('utf-8', errors='replace'), 'time': now})
     
     def send_command(self, cmd_type, data=None):
-        cmd = {"type": cmd_type}
-        if data is not None:
-            cmd["data"] = data
-        line = json.dumps(cmd) + "\n"
-        self.process.stdin.write(line.encode('utf-8'))
+        if data is None:
+            line = _encode_command(cmd_type)
+        elif orjson is not None:
+            line = orjson.dumps({"type": cmd_type, "data": data}) + b"\n"
+        else:
+            line = (json.dumps({"type": cmd_type, "data": data}) + "\n").encode('utf-8')
+        self.process.stdin.write(line)
         self.process.stdin.flush()
         return time.time()
     
     def wait_for_message(self, msg_type, timeout=10.0):
+        # Skips (consumes) non-matching messages, like the old queue did
         deadline = time.time() + timeout
-        while time.time() < deadline:
-            try:
+        with self._cond:
+            while True:
+                while self._cursor < len(self.stdout_lines):
+                    entry = self.stdout_lines[self._cursor]
+                    self._cursor += 1
+                    if entry['parsed'] and entry['parsed'].get('type') == msg_type:
+                        return entry
                 remaining = deadline - time.time()
                 if remaining <= 0:
-                    break
-                entry = self.stdout_queue.get(timeout=min(remaining, 0.5))
-                if entry['parsed'] and entry['parsed'].get('type') == msg_type:
-                    return entry
-            except queue.Empty:
-                continue
-        return None
+                    return None
+                self._cond.wait(remaining)
+    
+    @staticmethod
+    def _since(entries, times, since_time):
+        # Only the reader thread appends, so no lock: fix the end
+        # first, then bisect within it
+        end = len(times)
+        start = bisect.bisect_left(times, since_time, 0, end)
+        return entries[start:end]
+    
+    @staticmethod
+    def _is_update(entry):
+        # The raw-bytes peek in _store_line can let through a line that
+        # fails to parse (parsed is None) or isn't really an update
+        parsed = entry['parsed']
+        return bool(parsed) and parsed.get('type') == 'transcription_update'
     
     def get_transcriptions_since(self, since_time):
-        return [
-            e for e in self.stdout_lines
-            if e['parsed']
-            and e['parsed'].get('type') == 'transcription_update'
-            and e['time'] >= since_time
-        ]
+        # Every entry returned has a parsed dict, so callers can read
+        # ['parsed']['data'] directly
+        return [e for e in self._since(self._trans_entries, self._trans_times, since_time)
+                if self._is_update(e)]
+    
+    @staticmethod
+    def _is_final(entry):
+        parsed = entry['parsed']
+        return bool(parsed) and parsed.get('data', {}).get('isFinal', False)
     
     def get_finals_since(self, since_time):
-        return [
-            e for e in self.stdout_lines
-            if e['parsed']
-            and e['parsed'].get('type') == 'transcription_update'
-            and e['parsed'].get('data', {}).get('isFinal', False)
-            and e['time'] >= since_time
-        ]
+        return [e for e in self.get_transcriptions_since(since_time) if self._is_final(e)]
+    
+    def wait_for_update_since(self, since_time, timeout=10.0, predicate=None):
+        # Returns the first update at/after since_time matching predicate
+        # (any update if None) as soon as it arrives, or None at timeout —
+        # instead of a fixed sleep. Only updates not yet checked are
+        # tested on each wakeup.
+        deadline = time.time() + timeout
+        checked = 0
+        with self._cond:
+            while True:
+                updates = self.get_transcriptions_since(since_time)
+                for entry in updates[checked:]:
+                    if predicate is None or predicate(entry):
+                        return entry
+                checked = len(updates)
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return None
+                self._cond.wait(remaining)
+    
+    def wait_for_final_since(self, since_time, timeout=10.0):
+        return self.wait_for_update_since(since_time, timeout, self._is_final)
     
     def get_last_text_since(self, since_time):
         transcriptions = self.get_transcriptions_since(since_time)
@@ -134,11 +241,9 @@ class SpeechHelperProcess:
         return transcriptions[-1]['parsed']['data'].get('text', '')
     
     def drain_queue(self):
-        while not self.stdout_queue.empty():
-            try:
-                self.stdout_queue.get_nowait()
-            except queue.Empty:
-                break
+        # Mark everything received so far as consumed
+        with self._cond:
+            self._cursor = len(self.stdout_lines)
     
     def stop(self):
         self._running = False
@@ -157,29 +262,60 @@ class SpeechHelperProcess:
                     pass
 
 
+# Rendered `say` prompts, keyed by (text, rate). `say` output is
+# deterministic, so repeated prompts (and reruns) skip synthesis.
+AIFF_CACHE_DIR = "/tmp/bv_sttcache"
+
+
+def cached_say_aiff(text, rate=140):
+    """Return the path of an AIFF of `text` at `rate`, rendering it only on a cache miss."""
+    key = hashlib.blake2b(f"{text}|{rate}".encode('utf-8')).hexdigest()[:16]
+    aiff_path = os.path.join(AIFF_CACHE_DIR, f"{key}.aiff")
+    if not os.path.isfile(aiff_path):
+        os.makedirs(AIFF_CACHE_DIR, exist_ok=True)
+        # Render under a temp name so an interrupted run can't cache a truncated file
+        tmp_path = f"{aiff_path}.{os.getpid()}.tmp.aiff"
+        result = subprocess.run(["/usr/bin/say", "-r", str(rate), "-o", tmp_path, text],
+                                capture_output=True, timeout=60)
+        if result.returncode != 0:
+            # Never cache a failed render; a missing or partial file would be replayed forever
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            stderr = result.stderr.decode('utf-8', errors='replace').strip()
+            raise RuntimeError(f"say failed (exit {result.returncode}) for {text!r}: {stderr}")
+        os.replace(tmp_path, aiff_path)
+    return aiff_path
+
+
 def say_and_wait(text, rate=140, volume=None):
-    """Play text using say command. Returns duration in seconds."""
+    """Play text (from the AIFF cache) and wait. Returns playback duration in seconds."""
+    aiff_path = cached_say_aiff(text, rate)
+    cmd = ["afplay", aiff_path] if volume is None else ["afplay", "-v", str(volume), aiff_path]
     start = time.time()
-    cmd = ["/usr/bin/say", "-r", str(rate), text]
-    proc = subprocess.run(cmd, capture_output=True, timeout=60)
+    subprocess.run(cmd, capture_output=True, timeout=60)
     return time.time() - start
 
 
+def play_async(text, rate=140, volume=None):
+    """Start playing text (from the AIFF cache) without waiting. Returns the afplay Popen."""
+    aiff_path = cached_say_aiff(text, rate)
+    cmd = ["afplay", aiff_path] if volume is None else ["afplay", "-v", str(volume), aiff_path]
+    return subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
 def say_to_aiff_and_play(text, rate=140, volume=0.5):
-    """Render to AIFF then play with volume control. Returns duration."""
-    start = time.time()
-    aiff_path = f"/tmp/stt_test_{os.getpid()}.aiff"
-    subprocess.run(["/usr/bin/say", "-r", str(rate), "-o", aiff_path, text],
-                   capture_output=True, timeout=60)
-    subprocess.run(["afplay", "-v", str(volume), aiff_path],
-                   capture_output=True, timeout=60)
-    return time.time() - start
+    """Play text from the AIFF cache with volume control. Returns playback duration."""
+    return say_and_wait(text, rate=rate, volume=volume)
+
+
+# Punctuation word_accuracy ignores, removed in one translate() pass
+_PUNCT_TABLE = str.maketrans('', '', ',.?!')
 
 
 def word_accuracy(expected, got):
     """Calculate word-level accuracy between expected and got text."""
-    expected_words = set(expected.lower().replace(',', '').replace('.', '').replace('?', '').replace('!', '').split())
-    got_words = set(got.lower().replace(',', '').replace('.', '').replace('?', '').replace('!', '').split())
+    expected_words = frozenset(expected.lower().translate(_PUNCT_TABLE).split())
+    got_words = frozenset(got.lower().translate(_PUNCT_TABLE).split())
     if not expected_words:
         return 0.0
     matched = len(expected_words & got_words)
@@ -193,42 +329,44 @@ def word_accuracy(expected, got):
 class MarkdownWriter:
     def __init__(self, filepath):
         self.filepath = filepath
-        self.sections = []
+        # One growing buffer instead of a list of small strings
+        self.buf = io.StringIO()
         self.current_section = None
     
     def start_doc(self, title):
-        self.sections.append(f"# {title}\n")
-        self.sections.append(f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        self.sections.append(f"**Platform**: macOS 26.1 (SpeechAnalyzer + SpeechTranscriber)\n")
-        self.sections.append(f"**Helper**: `{HELPER_BIN}`\n\n")
-        self.sections.append("---\n\n")
+        self.buf.write(
+            f"# {title}\n"
+            f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"**Platform**: macOS 26.1 (SpeechAnalyzer + SpeechTranscriber)\n"
+            f"**Helper**: `{HELPER_BIN}`\n\n"
+            "---\n\n"
+        )
     
     def add_section(self, title, level=2):
         prefix = "#" * level
-        self.sections.append(f"\n{prefix} {title}\n\n")
+        self.buf.write(f"\n{prefix} {title}\n\n")
     
     def add_text(self, text):
-        self.sections.append(f"{text}\n\n")
+        self.buf.write(f"{text}\n\n")
     
     def add_result(self, label, value):
-        self.sections.append(f"- **{label}**: {value}\n")
+        self.buf.write(f"- **{label}**: {value}\n")
     
     def add_code(self, text, lang=""):
-        self.sections.append(f"```{lang}\n{text}\n```\n\n")
+        self.buf.write(f"```{lang}\n{text}\n```\n\n")
     
     def add_table_header(self, cols):
-        self.sections.append("| " + " | ".join(cols) + " |\n")
-        self.sections.append("| " + " | ".join(["---"] * len(cols)) + " |\n")
+        self.buf.write(f"| {' | '.join(cols)} |\n| {' | '.join(['---'] * len(cols))} |\n")
     
     def add_table_row(self, cols):
-        self.sections.append("| " + " | ".join(str(c) for c in cols) + " |\n")
+        self.buf.write("| " + " | ".join(str(c) for c in cols) + " |\n")
     
     def add_newline(self):
-        self.sections.append("\n")
+        self.buf.write("\n")
     
     def save(self):
         with open(self.filepath, 'w') as f:
-            f.writelines(self.sections)
+            f.write(self.buf.getvalue())
 
 
 # ============================================================
@@ -257,17 +395,20 @@ def main():
     md.add_text("Measures time from `start_listening` to the first `transcription_update`. "
                 "This tells us how quickly the SpeechAnalyzer pipeline warms up and produces output.")
     
+    # Render the prompt now so the first trial's latency doesn't include synthesis
+    cached_say_aiff("hello", 140)
+    
     latencies = []
     for trial in range(3):
         start_time = helper.send_command("start_listening")
         time.sleep(2)  # let it warm up
         
-        # Play a single short word
+        # Play a single short word and watch for the first update while
+        # it plays; about the old playback + 3s sleep is the upper bound
         say_start = time.time()
-        say_and_wait("hello", rate=140)
-        
-        # Wait for result
-        time.sleep(3)
+        player = play_async("hello", rate=140)
+        helper.wait_for_update_since(start_time, timeout=4)
+        player.wait(timeout=60)
         
         transcriptions = helper.get_transcriptions_since(start_time)
         if transcriptions:
@@ -326,7 +467,10 @@ def main():
         time.sleep(2.5)
         
         say_dur = say_and_wait(test_phrase, rate=rate)
-        time.sleep(4)
+        # Up to 4s for the final of the last segment, moving on as soon
+        # as it lands. Slow rates split the phrase into several finals,
+        # so one emitted during playback doesn't end the wait.
+        helper.wait_for_final_since(time.time(), timeout=4)
         
         finals = helper.get_finals_since(start_time)
         last_text = helper.get_last_text_since(start_time)
@@ -418,7 +562,8 @@ def main():
         time.sleep(2.5)
         
         say_and_wait(phrase, rate=140)
-        time.sleep(4)
+        # Only a final after playback ends covers the whole phrase
+        helper.wait_for_final_since(time.time(), timeout=4)
         
         finals = helper.get_finals_since(start_time)
         last_text = helper.get_last_text_since(start_time)